@@ -325,20 +325,10 @@ class BACnetMonitor:
                                 f"Read value for {metadata['iot_device_point_id']} using wrapper {wrapper.instance_id}: {raw_properties}"
                             )
 
-                            # Process health properties (including optional BACnet properties)
-                            health_data = (
-                                BACnetHealthProcessor.process_all_health_properties(
-                                    raw_properties
-                                )
-                            )
-                            # Process optional BACnet properties
-                            optional_properties = (
-                                BACnetHealthProcessor.process_all_optional_properties(
-                                    raw_properties
-                                )
+                            # Process health and optional BACnet properties
+                            health_data = BACnetHealthProcessor.process_all(
+                                raw_properties
                             )
-                            # Merge health and optional properties
-                            health_data.update(optional_properties)
                             logger.debug(f"Health data: {health_data}")
 
                             # Create controller point with health data for bulk insert
@@ -468,16 +458,8 @@ class BACnetMonitor:
                 f"Individual fallback read value for {each_object.iot_device_point_id} using wrapper {wrapper.instance_id}: {raw_properties}"
             )
 
-            # Process health properties (including optional BACnet properties)
-            health_data = BACnetHealthProcessor.process_all_health_properties(
-                raw_properties
-            )
-            # Process optional BACnet properties
-            optional_properties = BACnetHealthProcessor.process_all_optional_properties(
-                raw_properties
-            )
-            # Merge health and optional properties
-            health_data.update(optional_properties)
+            # Process health and optional BACnet properties
+            health_data = BACnetHealthProcessor.process_all(raw_properties)
             logger.debug(f"Health data: {health_data}")
 
             # Create controller point with health data
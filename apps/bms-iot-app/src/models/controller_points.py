@@ -5,7 +5,11 @@ from datetime import datetime, timezone
 from sqlalchemy import Column, Computed, BigInteger
 
 from src.models.bacnet_types import BacnetObjectTypeEnum
-from src.network.sqlmodel_client import get_session, with_db_retry
+from src.network.sqlmodel_client import (
+    get_session,
+    get_write_session,
+    with_db_retry,
+)
 from src.config.config import DEFAULT_CONTROLLER_PORT
 from src.utils.logger import logger
 from src.utils.performance import performance_metrics
@@ -154,7 +158,7 @@ class ControllerPointsModel(SQLModel, table=True):  # type: ignore[call-arg]
 async def insert_controller_point(
     point: ControllerPointsModel,
 ) -> ControllerPointsModel:
-    async with get_session() as session:
+    async with get_write_session() as session:
         session.add(point)
         await session.commit()
         await session.refresh(point)
@@ -196,7 +200,7 @@ async def bulk_insert_controller_points(
 
     logger.info(f"Bulk inserting {len(points)} controller points")
 
-    async with get_session() as session:
+    async with get_write_session() as session:
         # Defensive ID validation (fix id=0 issue for future-proofing)
         for point in points:
             if point.id == 0:
@@ -241,10 +245,10 @@ async def get_controller_points_by_controller_id(
 @with_db_retry(max_retries=3, base_delay=0.1)
 async def delete_uploaded_points() -> int:
     """Delete all controller points where is_uploaded is True. Returns the number of deleted rows."""
-    async with get_session() as session:
+    async with get_write_session() as session:
         result = await session.execute(
             select(ControllerPointsModel).where(
-                ControllerPointsModel.is_uploaded is True
+                ControllerPointsModel.is_uploaded.is_(True)  # type: ignore[attr-defined]
             )
         )
         points_to_delete = list(result.scalars().all())
@@ -267,7 +271,7 @@ async def mark_points_as_uploaded(points: list[ControllerPointsModel]):
     # Ensure all IDs are integers (mypy type assertion)
     assert all(isinstance(id_val, int) for id_val in ids), "All IDs must be integers"
 
-    async with get_session() as session:
+    async with get_write_session() as session:
         await session.execute(
             update(ControllerPointsModel)
             .where(ControllerPointsModel.id.in_(ids))  # type: ignore[union-attr]
@@ -276,14 +280,20 @@ async def mark_points_as_uploaded(points: list[ControllerPointsModel]):
         await session.commit()
 
 
+# Built once: SQLAlchemy memoizes the cache key on the statement object, so each
+# upload poll goes straight to the engine's compiled statement cache instead of
+# rebuilding the select and its key for every column
+_POINTS_TO_UPLOAD_QUERY = (
+    select(ControllerPointsModel)
+    .where(ControllerPointsModel.is_uploaded.is_(False))  # type: ignore[attr-defined]
+    .order_by(ControllerPointsModel.created_at)
+    .limit(100)  # type: ignore[arg-type]
+)
+
+
 @with_db_retry(max_retries=3, base_delay=0.1)
 async def get_points_to_upload() -> list[ControllerPointsModel]:
     """Fetch all controller points where is_uploaded is False."""
     async with get_session() as session:
-        result = await session.execute(
-            select(ControllerPointsModel)
-            .where(ControllerPointsModel.is_uploaded is False)
-            .order_by(ControllerPointsModel.created_at)
-            .limit(100)  # type: ignore[arg-type]
-        )
+        result = await session.execute(_POINTS_TO_UPLOAD_QUERY)
         return list(result.scalars().all())
@@ -1,11 +1,15 @@
 from typing import Optional
-from sqlmodel import SQLModel, Field, select
+from sqlmodel import SQLModel, Field, insert, select, update
 from datetime import datetime, timezone
 from sqlalchemy import Column, Computed, BigInteger
 import json
 
 from src.models.device_status_enums import MonitoringStatusEnum, ConnectionStatusEnum
-from src.network.sqlmodel_client import get_session, with_db_retry
+from src.network.sqlmodel_client import (
+    get_session,
+    get_write_session,
+    with_db_retry,
+)
 
 
 class IotDeviceStatusModel(SQLModel, table=True):  # type: ignore[call-arg]
@@ -80,7 +84,7 @@ async def upsert_iot_device_status(
     iot_device_id: str, status_data: dict
 ) -> IotDeviceStatusModel:
     """Upsert IoT device status. Only one row per device. Handles concurrent access safely."""
-    async with get_session() as session:
+    async with get_write_session() as session:
         # Update timestamp
         status_data["updated_at"] = datetime.now(timezone.utc)
         status_data["received_at"] = datetime.now(timezone.utc)
@@ -89,60 +93,38 @@ async def upsert_iot_device_status(
         if "payload" in status_data and isinstance(status_data["payload"], dict):
             status_data["payload"] = json.dumps(status_data["payload"])
 
-        try:
-            # First, try to update existing record
-            result = await session.execute(
-                select(IotDeviceStatusModel).where(
-                    IotDeviceStatusModel.iot_device_id == iot_device_id
+        columns = IotDeviceStatusModel.__table__.columns
+        values = {
+            key: value
+            for key, value in status_data.items()
+            if key in columns and key != "iot_device_id"
+        }
+
+        # The write session holds the write lock from the start, so no concurrent
+        # upsert can insert the row between this UPDATE and the INSERT below
+        result = await session.execute(
+            update(IotDeviceStatusModel)
+            .where(IotDeviceStatusModel.iot_device_id == iot_device_id)
+            .values(**values)
+        )
+        if result.rowcount == 0:
+            # Create new record
+            values.setdefault("created_at", datetime.now(timezone.utc))
+            await session.execute(
+                insert(IotDeviceStatusModel).values(
+                    iot_device_id=iot_device_id, **values
                 )
             )
-            existing_status = result.scalars().first()
-
-            if existing_status:
-                # Update existing record
-                for key, value in status_data.items():
-                    if hasattr(existing_status, key):
-                        setattr(existing_status, key, value)
-                await session.commit()
-                await session.refresh(existing_status)
-                return existing_status
-            else:
-                # Create new record
-                status_data["iot_device_id"] = iot_device_id
-                if "created_at" not in status_data:
-                    status_data["created_at"] = datetime.now(timezone.utc)
-
-                new_status = IotDeviceStatusModel(**status_data)
-                session.add(new_status)
-                await session.commit()
-                await session.refresh(new_status)
-                return new_status
-
-        except Exception as e:
-            await session.rollback()
-            error_msg = str(e).lower()
-
-            # Handle concurrent insert race condition
-            if "unique constraint failed" in error_msg and "iot_device_id" in error_msg:
-                # Another concurrent operation inserted the record, try to update it
-                result = await session.execute(
-                    select(IotDeviceStatusModel).where(
-                        IotDeviceStatusModel.iot_device_id == iot_device_id
-                    )
-                )
-                existing_status = result.scalars().first()
-
-                if existing_status:
-                    # Update the record that was just created by another operation
-                    for key, value in status_data.items():
-                        if hasattr(existing_status, key) and key != "iot_device_id":
-                            setattr(existing_status, key, value)
-                    await session.commit()
-                    await session.refresh(existing_status)
-                    return existing_status
-
-            # Re-raise other exceptions
-            raise
+
+        result = await session.execute(
+            select(IotDeviceStatusModel).where(
+                IotDeviceStatusModel.iot_device_id == iot_device_id
+            ),
+            execution_options={"populate_existing": True},
+        )
+        status = result.scalars().one()
+        await session.commit()
+        return status
 
 
 @with_db_retry(max_retries=3, base_delay=0.1)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Callable, Optional, List, Coroutine
+from typing import Any, Dict, Callable, Optional, List, Coroutine, Tuple
 from packages.mqtt_topics.topics_loader import (
     build_mqtt_topic_dict,
     Topics,
@@ -10,8 +10,10 @@ import asyncio
 import paho.mqtt.client as mqtt
 from src.models.controller_points import ControllerPointsModel
 from datetime import datetime
-import json
+import orjson
+from pydantic.fields import FieldInfo
 
+from src.utils.bacnet_health_processor import STATUS_FLAG_NAMES
 from src.utils.logger import logger
 
 MessageHandler = Callable[
@@ -19,33 +21,47 @@ MessageHandler = Callable[
 ]
 
 
-def _serialize_point(point: ControllerPointsModel):
-    """
-    Serialize ControllerPointsModel for MQTT transmission.
+# Every string process_status_flags stores for a bit mask, pre-split
+_STATUS_FLAGS_SPLIT: Dict[str, Tuple[str, ...]] = {
+    ";".join(flags): flags
+    for flags in (
+        tuple(name for i, name in enumerate(STATUS_FLAG_NAMES) if mask >> i & 1)
+        for mask in range(1, 1 << len(STATUS_FLAG_NAMES))
+    )
+}
 
-    Converts SQLite storage format to structured MQTT payload format,
-    including parsing JSON strings for complex BACnet properties.
-    """
-    data = point.model_dump()
-    for k, v in data.items():
-        if isinstance(v, datetime):
-            data[k] = v.isoformat()
-
-    # Decode health data from semicolon-separated strings to arrays for MQTT
-    if data.get("status_flags"):
-        try:
-            # Convert "fault;overridden" to ["fault", "overridden"]
-            data["status_flags"] = [
-                flag.strip() for flag in data["status_flags"].split(";") if flag.strip()
-            ]
-        except Exception as e:
-            logger.warning(
-                f"Failed to decode status_flags '{data['status_flags']}': {e}"
-            )
-            data["status_flags"] = None
 
-    # Parse JSON strings for complex BACnet optional properties
-    json_properties = [
+def _split_status_flags(name: str, value: Any) -> Any:
+    # Convert "fault;overridden" to ["fault", "overridden"]
+    if not value:
+        return value
+    try:
+        flags = _STATUS_FLAGS_SPLIT.get(value)
+        if flags is not None:
+            return list(flags)
+        return [flag.strip() for flag in value.split(";") if flag.strip()]
+    except Exception as e:
+        logger.warning(f"Failed to decode {name} '{value}': {e}")
+        return None
+
+
+def _parse_json_property(name: str, value: Any) -> Any:
+    if not value:
+        return value
+    try:
+        return orjson.loads(value)
+    except (orjson.JSONDecodeError, TypeError) as e:
+        logger.warning(f"Failed to parse JSON for {name} '{value}': {e}")
+        return None
+
+
+def _isoformat(name: str, value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+# Complex BACnet optional properties stored as JSON strings in SQLite
+_JSON_PROPERTIES = frozenset(
+    {
         "priority_array",
         "limit_enable",
         "event_enable",
@@ -54,15 +70,42 @@ def _serialize_point(point: ControllerPointsModel):
         "event_message_texts",
         "event_message_texts_config",
         "event_algorithm_inhibit_ref",
-    ]
-
-    for prop in json_properties:
-        if data.get(prop):
-            try:
-                data[prop] = json.loads(data[prop])
-            except (json.JSONDecodeError, TypeError) as e:
-                logger.warning(f"Failed to parse JSON for {prop} '{data[prop]}': {e}")
-                data[prop] = None
+    }
+)
+
+
+def _identity(name: str, value: Any) -> Any:
+    return value
+
+
+def _field_decoder(name: str, field: FieldInfo) -> Callable[[str, Any], Any]:
+    if name == "status_flags":
+        return _split_status_flags
+    if name in _JSON_PROPERTIES:
+        return _parse_json_property
+    if field.annotation is datetime:
+        return _isoformat
+    return _identity
+
+
+# The field set is fixed by the model, so pick each field's decoder once at import
+# instead of re-checking every field of every point
+_FIELD_DECODERS: Tuple[Tuple[str, Callable[[str, Any], Any]], ...] = tuple(
+    (name, _field_decoder(name, field))
+    for name, field in ControllerPointsModel.model_fields.items()
+)
+
+
+def _serialize_point(point: ControllerPointsModel):
+    """
+    Serialize ControllerPointsModel for MQTT transmission.
+
+    Converts SQLite storage format to structured MQTT payload format,
+    including parsing JSON strings for complex BACnet properties.
+    """
+    data = {
+        name: decode(name, getattr(point, name)) for name, decode in _FIELD_DECODERS
+    }
 
     # Add unix milli timestamp to the payload for influxDB.
     data["created_at_unix_milli_timestamp"] = point.created_at_unix_milli_timestamp
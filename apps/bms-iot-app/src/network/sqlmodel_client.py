@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy import text
+from sqlalchemy import event, text
 from ..config.paths import get_database_url
 from ..config.bacnet_constants import SQLITE_CACHE_SIZE_PAGES
 import asyncio
@@ -10,21 +10,46 @@ import sys
 import tempfile
 import os
 from collections import defaultdict
-from typing import DefaultDict
+from contextvars import ContextVar
+from typing import DefaultDict, Optional
+from weakref import WeakKeyDictionary
 
 logger = logging.getLogger(__name__)
 
+USE_TEST_DATABASE = "pytest" in sys.modules or "PYTEST_CURRENT_TEST" in os.environ
+
+# Warm connections kept per pytest process. Under `pytest -n auto` every xdist
+# worker imports this module separately and gets its own temp database and
+# engine, so the size does not scale with the worker count. Writers are
+# serialized by get_write_session, so one connection writes while the rest
+# serve concurrent readers; overflow absorbs the stress tests' bursts.
+SQLITE_TEST_POOL_SIZE = 4
+
 # Use test database if running under pytest
-if "pytest" in sys.modules or "PYTEST_CURRENT_TEST" in os.environ:
+if USE_TEST_DATABASE:
     # Create temporary test database for pytest
     test_db_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
     test_db_path = test_db_file.name
     test_db_file.close()
     DATABASE_URL = f"sqlite+aiosqlite:///{test_db_path}"
     logger.info(f"Using test database: {test_db_path}")
+    # Overflow stays enabled because a pool wait queue is bound to one event
+    # loop and some tests run several loops.
+    pool_args = {
+        "pool_size": SQLITE_TEST_POOL_SIZE,
+        "pool_recycle": -1,
+        "pool_pre_ping": False,
+    }
+    # Test data is disposable, so skip fsync entirely
+    sqlite_synchronous = "OFF"
 else:
     DATABASE_URL = get_database_url()
     logger.info(f"Using production database: {DATABASE_URL}")
+    pool_args = {
+        "poolclass": None,  # Use NullPool for SQLite - no connection pooling
+        "pool_pre_ping": True,  # Verify connections before use
+    }
+    sqlite_synchronous = "NORMAL"  # Balance safety/performance
 
 # SQLite-specific connection arguments for concurrency
 connect_args = {
@@ -37,12 +62,24 @@ connect_args = {
 engine = create_async_engine(
     DATABASE_URL,
     connect_args=connect_args,
-    poolclass=None,  # Use NullPool for SQLite - no connection pooling
-    pool_pre_ping=True,  # Verify connections before use
+    **pool_args,
     echo=False,
     future=True,
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_connection_pragmas(dbapi_connection, connection_record):
+    """These PRAGMAs are per connection, so apply them to every new one"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA synchronous={sqlite_synchronous};")
+    cursor.execute("PRAGMA busy_timeout=30000;")  # 30 second timeout
+    cursor.execute("PRAGMA temp_store=MEMORY;")  # Use memory for temp tables
+    cursor.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE_PAGES};")
+    cursor.execute("PRAGMA mmap_size=268435456;")  # 256MB memory map
+    cursor.close()
+
+
 async_session = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -50,19 +87,10 @@ async_session = async_sessionmaker(
 
 async def enable_wal_mode():
     """Enable Write-Ahead Logging for better SQLite concurrency"""
+    # journal_mode is stored in the database file; the per-connection
+    # settings are applied by _set_connection_pragmas
     async with engine.begin() as conn:
         await conn.execute(text("PRAGMA journal_mode=WAL;"))
-        await conn.execute(
-            text("PRAGMA synchronous=NORMAL;")
-        )  # Balance safety/performance
-        await conn.execute(text("PRAGMA busy_timeout=30000;"))  # 30 second timeout
-        await conn.execute(
-            text("PRAGMA temp_store=MEMORY;")
-        )  # Use memory for temp tables
-        await conn.execute(
-            text(f"PRAGMA cache_size={SQLITE_CACHE_SIZE_PAGES};")
-        )  # Increase cache size
-        await conn.execute(text("PRAGMA mmap_size=268435456;"))  # 256MB memory map
 
     logger.info("SQLite WAL mode and performance optimizations enabled")
 
@@ -288,3 +316,66 @@ async def get_session():
             logger.debug(
                 f"Cleaned up database session {session_id} (remaining active: {session_metrics['active_sessions']})"
             )
+
+
+# SQLite allows one writer at a time. Queueing writers here keeps them off the pool
+# and out of the busy handler, which polls with sleeps while holding a connection.
+# asyncio locks bind to the loop they first wait on, so there is one per loop.
+_write_locks: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    WeakKeyDictionary()
+)
+# Same bound as busy_timeout: a writer queued behind the lock for longer would
+# have failed with "database is locked" without it
+WRITE_LOCK_TIMEOUT_SECONDS = 30
+# Task currently inside get_write_session, to catch nesting before it deadlocks
+_write_session_owner: ContextVar[Optional[asyncio.Task]] = ContextVar(
+    "_write_session_owner", default=None
+)
+
+
+def _get_write_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = _write_locks.get(loop)
+    if lock is None:
+        lock = _write_locks[loop] = asyncio.Lock()
+    return lock
+
+
+@contextlib.asynccontextmanager
+async def get_write_session():
+    """
+    Session that takes the SQLite write lock up front with BEGIN IMMEDIATE.
+
+    Write sessions are serialized per event loop and are not re-entrant: opening
+    one while the current task already holds one raises RuntimeError instead of
+    waiting on itself forever. Waiting longer than WRITE_LOCK_TIMEOUT_SECONDS for
+    another writer raises TimeoutError.
+    """
+    task = asyncio.current_task()
+    if task is not None and _write_session_owner.get() is task:
+        raise RuntimeError(
+            "get_write_session() is not re-entrant; "
+            "reuse the open write session instead of opening another"
+        )
+
+    lock = _get_write_lock()
+    try:
+        async with asyncio.timeout(WRITE_LOCK_TIMEOUT_SECONDS):
+            await lock.acquire()
+    except TimeoutError:
+        raise TimeoutError(
+            f"Timed out after {WRITE_LOCK_TIMEOUT_SECONDS}s waiting for the "
+            "database write lock"
+        ) from None
+
+    token = _write_session_owner.set(task)
+    try:
+        # A deferred transaction only asks for the write lock at its first write
+        # and fails with "database is locked" if another writer got there first; an
+        # immediate one waits in busy_timeout instead of bouncing off with_db_retry
+        async with get_session() as session:
+            await session.execute(text("BEGIN IMMEDIATE"))
+            yield session
+    finally:
+        _write_session_owner.reset(token)
+        lock.release()
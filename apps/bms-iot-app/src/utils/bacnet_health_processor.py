@@ -1,8 +1,43 @@
-from typing import List, Optional, Union, Dict
+from typing import List, Optional, Union, Dict, Tuple
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# statusFlags bit order: [in-alarm, fault, overridden, out-of-service]
+STATUS_FLAG_NAMES: Tuple[str, ...] = (
+    "in-alarm",
+    "fault",
+    "overridden",
+    "out-of-service",
+)
+
+
+def _bit_mask(bits) -> int:
+    return sum(1 << i for i, bit in enumerate(bits) if bit)
+
+
+# The bit strings are only 2-4 bits wide, so every encoding is precomputed and a
+# lookup by bit mask replaces building the string per point
+_STATUS_FLAGS_BY_MASK: Tuple[Optional[str], ...] = tuple(
+    ";".join(name for i, name in enumerate(STATUS_FLAG_NAMES) if mask >> i & 1) or None
+    for mask in range(1 << len(STATUS_FLAG_NAMES))
+)
+_LIMIT_ENABLE_BY_MASK: Tuple[str, ...] = tuple(
+    json.dumps({"lowLimitEnable": bool(mask & 1), "highLimitEnable": bool(mask & 2)})
+    for mask in range(4)
+)
+_EVENT_TRANSITION_BITS_BY_MASK: Tuple[str, ...] = tuple(
+    json.dumps(
+        {
+            "toFault": bool(mask & 1),
+            "toNormal": bool(mask & 2),
+            "toOffnormal": bool(mask & 4),
+        }
+    )
+    for mask in range(8)
+)
+
 
 class BACnetHealthProcessor:
     """
@@ -51,7 +86,7 @@ class BACnetHealthProcessor:
                     return status_str
 
                 # If single flag, return it
-                if status_str in ["in-alarm", "fault", "overridden", "out-of-service"]:
+                if status_str in STATUS_FLAG_NAMES:
                     return status_str
 
                 # For other string formats, try to parse as space-separated or return as-is
@@ -59,12 +94,7 @@ class BACnetHealthProcessor:
 
             # Handle list of integers (original format)
             if isinstance(raw_flags, list) and len(raw_flags) == 4:
-                flag_names = ["in-alarm", "fault", "overridden", "out-of-service"]
-                active_flags = [
-                    flag_names[i] for i, flag in enumerate(raw_flags) if flag == 1
-                ]
-
-                return ";".join(active_flags) if active_flags else None
+                return _STATUS_FLAGS_BY_MASK[_bit_mask(flag == 1 for flag in raw_flags)]
             else:
                 logger.debug(
                     f"Invalid statusFlags format: {raw_flags} (type: {type(raw_flags)})"
@@ -182,8 +212,6 @@ class BACnetHealthProcessor:
             return None
 
         try:
-            import json
-
             # Handle BACnet PriorityArray object
             if hasattr(raw_priority_array, "__class__") and (
                 "PriorityArray" in str(raw_priority_array.__class__)
@@ -230,36 +258,26 @@ class BACnetHealthProcessor:
             return None
 
         try:
-            import json
-
             # Handle BACnet LimitEnable object
             if hasattr(raw_limit_enable, "__class__") and (
                 "LimitEnable" in str(raw_limit_enable.__class__)
                 or getattr(raw_limit_enable.__class__, "__name__", "") == "LimitEnable"
             ):
-                # Parse the string representation or bit array
-                limit_dict = {"lowLimitEnable": False, "highLimitEnable": False}
-
                 # Try to extract bit values
+                mask = 0
                 if hasattr(raw_limit_enable, "value"):
                     bits = raw_limit_enable.value
                     if len(bits) >= 2:
-                        limit_dict["lowLimitEnable"] = bool(bits[0])
-                        limit_dict["highLimitEnable"] = bool(bits[1])
+                        mask = _bit_mask(bits[:2])
 
-                return json.dumps(limit_dict)
+                return _LIMIT_ENABLE_BY_MASK[mask]
 
             # Handle list/array input [lowLimit, highLimit]
             elif (
                 isinstance(raw_limit_enable, (list, tuple))
                 and len(raw_limit_enable) >= 2
             ):
-                return json.dumps(
-                    {
-                        "lowLimitEnable": bool(raw_limit_enable[0]),
-                        "highLimitEnable": bool(raw_limit_enable[1]),
-                    }
-                )
+                return _LIMIT_ENABLE_BY_MASK[_bit_mask(raw_limit_enable[:2])]
 
             return None
         except Exception as e:
@@ -288,38 +306,23 @@ class BACnetHealthProcessor:
             return None
 
         try:
-            import json
-
             # Handle BACnet EventTransitionBits object
             if hasattr(raw_bits, "__class__") and (
                 "EventTransitionBits" in str(raw_bits.__class__)
                 or getattr(raw_bits.__class__, "__name__", "") == "EventTransitionBits"
             ):
-                transition_dict = {
-                    "toFault": False,
-                    "toNormal": False,
-                    "toOffnormal": False,
-                }
-
                 # Extract bit values
+                mask = 0
                 if hasattr(raw_bits, "value"):
                     bits = raw_bits.value
                     if len(bits) >= 3:
-                        transition_dict["toFault"] = bool(bits[0])
-                        transition_dict["toNormal"] = bool(bits[1])
-                        transition_dict["toOffnormal"] = bool(bits[2])
+                        mask = _bit_mask(bits[:3])
 
-                return json.dumps(transition_dict)
+                return _EVENT_TRANSITION_BITS_BY_MASK[mask]
 
             # Handle list input [toFault, toNormal, toOffnormal]
             elif isinstance(raw_bits, (list, tuple)) and len(raw_bits) >= 3:
-                return json.dumps(
-                    {
-                        "toFault": bool(raw_bits[0]),
-                        "toNormal": bool(raw_bits[1]),
-                        "toOffnormal": bool(raw_bits[2]),
-                    }
-                )
+                return _EVENT_TRANSITION_BITS_BY_MASK[_bit_mask(raw_bits[:3])]
 
             return None
         except Exception as e:
@@ -345,8 +348,6 @@ class BACnetHealthProcessor:
             return None
 
         try:
-            import json
-
             timestamps: List[Optional[str]] = []
 
             # Process array of timestamps
@@ -389,8 +390,6 @@ class BACnetHealthProcessor:
             return None
 
         try:
-            import json
-
             messages = []
 
             # Process array of messages
@@ -429,8 +428,6 @@ class BACnetHealthProcessor:
             return None
 
         try:
-            import json
-
             ref_dict: Dict[str, Union[str, int, None]] = {}
 
             # Handle BACnet ObjectPropertyReference
@@ -455,65 +452,90 @@ class BACnetHealthProcessor:
 
         Returns dict with processed properties ready for database storage.
         """
-        return {
-            # Value limits (simple Real values - no processing needed)
-            "min_pres_value": raw_properties.get("minPresValue"),
-            "max_pres_value": raw_properties.get("maxPresValue"),
-            "high_limit": raw_properties.get("highLimit"),
-            "low_limit": raw_properties.get("lowLimit"),
-            "resolution": raw_properties.get("resolution"),
-            # Control properties
-            "priority_array": BACnetHealthProcessor.process_priority_array(
-                raw_properties.get("priorityArray")
-            ),
-            "relinquish_default": raw_properties.get("relinquishDefault"),
-            # Notification config
-            "cov_increment": raw_properties.get("covIncrement"),
-            "time_delay": raw_properties.get("timeDelay"),
-            "time_delay_normal": raw_properties.get("timeDelayNormal"),
-            "notification_class": raw_properties.get("notificationClass"),
-            "notify_type": (
-                str(raw_properties.get("notifyType"))
-                if raw_properties.get("notifyType")
-                else None
-            ),
-            "deadband": raw_properties.get("deadband"),
-            "limit_enable": BACnetHealthProcessor.process_limit_enable(
-                raw_properties.get("limitEnable")
-            ),
-            # Event properties
-            "event_enable": BACnetHealthProcessor.process_event_transition_bits(
-                raw_properties.get("eventEnable"), "eventEnable"
-            ),
-            "acked_transitions": BACnetHealthProcessor.process_event_transition_bits(
+        result: dict = {}
+        BACnetHealthProcessor._add_optional_properties(raw_properties, result)
+        return result
+
+    @staticmethod
+    def process_all(raw_properties: dict) -> dict:
+        """
+        Process health and optional BACnet properties into a single dict.
+
+        Same keys as merging process_all_health_properties and
+        process_all_optional_properties, without building a second dict per point.
+        """
+        result = BACnetHealthProcessor.process_all_health_properties(raw_properties)
+        BACnetHealthProcessor._add_optional_properties(raw_properties, result)
+        return result
+
+    @staticmethod
+    def _add_optional_properties(raw_properties: dict, result: dict) -> None:
+        """Write the processed optional properties into ``result``."""
+        # Value limits (simple Real values - no processing needed)
+        result["min_pres_value"] = raw_properties.get("minPresValue")
+        result["max_pres_value"] = raw_properties.get("maxPresValue")
+        result["high_limit"] = raw_properties.get("highLimit")
+        result["low_limit"] = raw_properties.get("lowLimit")
+        result["resolution"] = raw_properties.get("resolution")
+        # Control properties
+        result["priority_array"] = BACnetHealthProcessor.process_priority_array(
+            raw_properties.get("priorityArray")
+        )
+        result["relinquish_default"] = raw_properties.get("relinquishDefault")
+        # Notification config
+        result["cov_increment"] = raw_properties.get("covIncrement")
+        result["time_delay"] = raw_properties.get("timeDelay")
+        result["time_delay_normal"] = raw_properties.get("timeDelayNormal")
+        result["notification_class"] = raw_properties.get("notificationClass")
+        result["notify_type"] = (
+            str(raw_properties.get("notifyType"))
+            if raw_properties.get("notifyType")
+            else None
+        )
+        result["deadband"] = raw_properties.get("deadband")
+        result["limit_enable"] = BACnetHealthProcessor.process_limit_enable(
+            raw_properties.get("limitEnable")
+        )
+        # Event properties
+        result["event_enable"] = BACnetHealthProcessor.process_event_transition_bits(
+            raw_properties.get("eventEnable"), "eventEnable"
+        )
+        result["acked_transitions"] = (
+            BACnetHealthProcessor.process_event_transition_bits(
                 raw_properties.get("ackedTransitions"), "ackedTransitions"
-            ),
-            "event_time_stamps": BACnetHealthProcessor.process_event_timestamps(
-                raw_properties.get("eventTimeStamps")
-            ),
-            "event_message_texts": BACnetHealthProcessor.process_event_message_texts(
+            )
+        )
+        result["event_time_stamps"] = BACnetHealthProcessor.process_event_timestamps(
+            raw_properties.get("eventTimeStamps")
+        )
+        result["event_message_texts"] = (
+            BACnetHealthProcessor.process_event_message_texts(
                 raw_properties.get("eventMessageTexts")
-            ),
-            "event_message_texts_config": BACnetHealthProcessor.process_event_message_texts(
+            )
+        )
+        result["event_message_texts_config"] = (
+            BACnetHealthProcessor.process_event_message_texts(
                 raw_properties.get("eventMessageTextsConfig")
-            ),
-            # Algorithm control
-            "event_detection_enable": (
-                bool(raw_properties.get("eventDetectionEnable"))
-                if raw_properties.get("eventDetectionEnable") is not None
-                else None
-            ),
-            "event_algorithm_inhibit_ref": BACnetHealthProcessor.process_object_property_reference(
+            )
+        )
+        # Algorithm control
+        result["event_detection_enable"] = (
+            bool(raw_properties.get("eventDetectionEnable"))
+            if raw_properties.get("eventDetectionEnable") is not None
+            else None
+        )
+        result["event_algorithm_inhibit_ref"] = (
+            BACnetHealthProcessor.process_object_property_reference(
                 raw_properties.get("eventAlgorithmInhibitRef")
-            ),
-            "event_algorithm_inhibit": (
-                bool(raw_properties.get("eventAlgorithmInhibit"))
-                if raw_properties.get("eventAlgorithmInhibit") is not None
-                else None
-            ),
-            "reliability_evaluation_inhibit": (
-                bool(raw_properties.get("reliabilityEvaluationInhibit"))
-                if raw_properties.get("reliabilityEvaluationInhibit") is not None
-                else None
-            ),
-        }
+            )
+        )
+        result["event_algorithm_inhibit"] = (
+            bool(raw_properties.get("eventAlgorithmInhibit"))
+            if raw_properties.get("eventAlgorithmInhibit") is not None
+            else None
+        )
+        result["reliability_evaluation_inhibit"] = (
+            bool(raw_properties.get("reliabilityEvaluationInhibit"))
+            if raw_properties.get("reliabilityEvaluationInhibit") is not None
+            else None
+        )
@@ -130,12 +130,14 @@ def sample_mqtt_config():
     }
 
 
-@pytest.fixture
-def event_loop():
-    """Create event loop for async tests"""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop where it is available"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest_asyncio.fixture(scope="session", autouse=True)
@@ -181,6 +183,10 @@ async def setup_database():
         print(f"❌ Global test database setup failed: {e}")
         raise
 
+    yield engine
+
+    await engine.dispose()
+
 
 # Pytest configuration for asyncio
 def pytest_configure(config):
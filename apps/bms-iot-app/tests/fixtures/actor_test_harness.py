@@ -6,12 +6,28 @@ with proper message flow validation and actor lifecycle management.
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Callable
+from collections import defaultdict, deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from unittest.mock import Mock, AsyncMock
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 import time
 
+MESSAGE_LOG_LIMIT = 4096
+
 
 @dataclass
 class MessageLog:
@@ -25,6 +41,38 @@ class MessageLog:
     message_id: str = field(default_factory=lambda: str(id(object())))
 
 
+@dataclass(slots=True, frozen=True)
+class Message:
+    """Typed actor message; optional fields left at their defaults are omitted"""
+
+    type: str
+    sender: str
+    receiver: str
+    payload: Dict[str, Any]
+    id: str = ""
+    priority: str = "normal"
+    sequence: int = -1
+    require_ack: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictionary form used by the harness routing internals"""
+        message = {
+            "type": self.type,
+            "sender": self.sender,
+            "receiver": self.receiver,
+            "payload": self.payload,
+        }
+        if self.id:
+            message["id"] = self.id
+        if self.priority != "normal":
+            message["priority"] = self.priority
+        if self.sequence >= 0:
+            message["sequence"] = self.sequence
+        if self.require_ack:
+            message["require_ack"] = True
+        return message
+
+
 class ActorTestHarness:
     """
     Test harness for actor integration testing.
@@ -33,20 +81,38 @@ class ActorTestHarness:
     setting up the full Pykka system during unit tests.
     """
 
-    def __init__(self):
+    def __init__(self, sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
         self.actors: Dict[str, Mock] = {}
-        self.messages: List[Dict[str, Any]] = []  # All messages
+        self.messages: Deque[Dict[str, Any]] = deque(maxlen=MESSAGE_LOG_LIMIT)
         self.message_log: List[MessageLog] = []
         self.message_handlers: Dict[str, List[Callable]] = {}
         self._running = False
         self._initialized = False
         self._cleaned_up = False
-        self._message_logging_enabled = False
-        self._actor_messages: Dict[str, List[Dict[str, Any]]] = {}
+        self._actor_messages: DefaultDict[str, Deque[Dict[str, Any]]] = defaultdict(
+            deque
+        )
         self._start_time = time.time()
+        self._sleep = sleep
         self._message_queue_limits: Dict[str, int] = {}
         self._routing_rules: Dict[str, str] = {}
         self._subscriptions: Dict[str, List[str]] = {}
+        self._delivery_events: Dict[Tuple[str, str], asyncio.Event] = {}
+        self._seen_types: DefaultDict[str, Set[str]] = defaultdict(set)
+        self._messages_by_id: DefaultDict[str, Dict[str, Dict[str, Any]]] = defaultdict(
+            dict
+        )
+        self._errors_by_original_id: Dict[str, Dict[str, Any]] = {}
+        self._dispatch_counts: DefaultDict[str, int] = defaultdict(int)
+        self.messages_by_type: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(
+            list
+        )
+        self._actor_messages_by_type: DefaultDict[
+            Tuple[str, str], List[Dict[str, Any]]
+        ] = defaultdict(list)
+        self._dispatch_events: DefaultDict[str, asyncio.Event] = defaultdict(
+            asyncio.Event
+        )
 
         # Mock external components
         self.mqtt_client = AsyncMock()
@@ -94,6 +160,7 @@ class ActorTestHarness:
         actor.sent_messages = []
         actor.config = config.get(name, {}) if config else {}
         actor.status = "healthy"
+        actor.mailbox = deque()
 
         # Special handling for MQTT actor
         if name == "mqtt":
@@ -105,7 +172,7 @@ class ActorTestHarness:
 
         self.actors[name] = actor
         self.message_handlers[name] = []
-        self._actor_messages[name] = []
+        self._actor_messages[name] = actor.mailbox
 
     def _create_tell_handler(self, actor_name: str):
         """Create a tell message handler for an actor"""
@@ -127,16 +194,9 @@ class ActorTestHarness:
             if actor_name in self.actors:
                 self.actors[actor_name].received_messages.append(message)
                 self._actor_messages[actor_name].append(message)
+                self._track_delivery(actor_name, message)
 
-            # Add to global messages if logging enabled
-            if self._message_logging_enabled:
-                self.messages.append(message)
-
-            # Handle broadcast messages
-            if message.get("receiver") == "BROADCAST":
-                for other_actor in self.actors:
-                    if other_actor != actor_name:
-                        self._actor_messages[other_actor].append(message)
+            self.messages.append(message)
 
             # Call registered message handlers
             for handler in self.message_handlers.get(actor_name, []):
@@ -146,6 +206,81 @@ class ActorTestHarness:
 
         return tell_handler
 
+    def _track_delivery(self, actor_name: str, message: Dict[str, Any]) -> None:
+        """Index a delivery and wake up anyone waiting for it at this actor"""
+        message_type = message.get("type", message.get("message_type"))
+        self._seen_types[actor_name].add(message_type)
+        self._actor_messages_by_type[(actor_name, message_type)].append(message)
+        if "id" in message:
+            self._messages_by_id[actor_name].setdefault(message["id"], message)
+        self._delivery_events.setdefault(
+            (actor_name, message_type), asyncio.Event()
+        ).set()
+
+    def by_type(self, message_type: str) -> List[Dict[str, Any]]:
+        """Messages of a type dispatched through the harness, in send order"""
+        return self.messages_by_type[message_type]
+
+    def actor_by_type(self, actor_name: str, message_type: str) -> List[Dict[str, Any]]:
+        """Messages of a type delivered to an actor, in delivery order"""
+        return self._actor_messages_by_type[(actor_name, message_type)]
+
+    def first_by_type(
+        self, actor_name: str, message_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """First message of a type delivered to an actor, or None"""
+        messages = self._actor_messages_by_type.get((actor_name, message_type))
+        return messages[0] if messages else None
+
+    def has_message_type(self, actor_name: str, message_type: str) -> bool:
+        """Check whether an actor has received a message of the given type"""
+        return message_type in self._seen_types[actor_name]
+
+    def has_message_id(self, actor_name: str, message_id: str) -> bool:
+        """Check whether an actor has received a message with the given id"""
+        return message_id in self._messages_by_id[actor_name]
+
+    def get_by_id(self, actor_name: str, message_id: str) -> Optional[Dict[str, Any]]:
+        """First message with the given id delivered to an actor, or None"""
+        return self._messages_by_id[actor_name].get(message_id)
+
+    def error_for(self, message_id: str) -> Optional[Dict[str, Any]]:
+        """DELIVERY_ERROR sent back for the message with the given id, or None"""
+        return self._errors_by_original_id.get(message_id)
+
+    async def wait_for_delivery(
+        self, actor_name: str, message_type: str, timeout: float = 1.0
+    ) -> None:
+        """
+        Wait until an actor has received a message of the given type.
+
+        Returns as soon as the delivery is recorded instead of sleeping for a
+        fixed interval.
+
+        Raises:
+            TimeoutError: If no such message arrives within timeout
+        """
+        event = self._delivery_events.setdefault(
+            (actor_name, message_type), asyncio.Event()
+        )
+        async with asyncio.timeout(timeout):
+            await event.wait()
+
+    async def wait_for(
+        self, message_type: str, count: int = 1, timeout: float = 1.0
+    ) -> None:
+        """
+        Wait until at least count messages of a type have been dispatched.
+
+        Raises:
+            TimeoutError: If fewer than count arrive within timeout
+        """
+        async with asyncio.timeout(timeout):
+            while self._dispatch_counts[message_type] < count:
+                event = self._dispatch_events[message_type]
+                event.clear()
+                await event.wait()
+
     async def cleanup(self) -> None:
         """Cleanup the actor system"""
         for actor_name in list(self.actors.keys()):
@@ -157,11 +292,41 @@ class ActorTestHarness:
         self.messages.clear()
         self._actor_messages.clear()
         self.message_handlers.clear()
+        self._clear_indexes()
 
         self._initialized = False
         self._running = False
         self._cleaned_up = True
 
+    def reset(self) -> None:
+        """
+        Clear all per-test state while keeping the actors alive.
+
+        Lets a single initialized harness be shared across tests.
+        """
+        self.messages.clear()
+        self.message_log.clear()
+        for actor_name, actor in self.actors.items():
+            actor.mailbox.clear()
+            self.message_handlers[actor_name] = []
+            actor.received_messages.clear()
+            actor.sent_messages.clear()
+        self._message_queue_limits.clear()
+        self._routing_rules.clear()
+        self._subscriptions.clear()
+        self._clear_indexes()
+
+    def _clear_indexes(self) -> None:
+        """Clear every delivery and dispatch index built from sent messages"""
+        self._delivery_events.clear()
+        self._seen_types.clear()
+        self._messages_by_id.clear()
+        self._errors_by_original_id.clear()
+        self._dispatch_counts.clear()
+        self.messages_by_type.clear()
+        self._actor_messages_by_type.clear()
+        self._dispatch_events.clear()
+
     def get_actor(self, name: str) -> Optional[Mock]:
         """Get an actor by name"""
         return self.actors.get(name)
@@ -175,22 +340,33 @@ class ActorTestHarness:
         return self._initialized
 
     def enable_message_logging(self) -> None:
-        """Enable message logging"""
-        self._message_logging_enabled = True
+        """No-op kept for existing callers; messages are always logged"""
 
     def _record_message(self, message: Dict[str, Any]) -> None:
-        """Record a message"""
-        if self._message_logging_enabled:
-            self.messages.append(message)
+        """Record a message and count it as dispatched for its type"""
+        self.messages.append(message)
+        message_type = message.get("type", message.get("message_type"))
+        self._dispatch_counts[message_type] += 1
+        self.messages_by_type[message_type].append(message)
+        self._dispatch_events[message_type].set()
 
     async def send_message(
-        self, message_or_sender, receiver=None, message_type=None, payload=None
+        self,
+        message_or_sender,
+        receiver=None,
+        message_type=None,
+        payload=None,
+        to: Optional[Mock] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Send a message through the actor system.
 
+        Passing an actor ref from get_actor() as ``to`` delivers straight to
+        that actor without resolving the receiver name.
+
         Supports both new dictionary interface and legacy parameter interface:
         - New: send_message({'type': 'TEST', 'sender': 'A', 'receiver': 'B', 'payload': {}})
+          or send_message(Message(type='TEST', sender='A', receiver='B', payload={}))
         - Legacy: send_message('A', 'B', 'TEST', {})
 
         Returns:
@@ -203,8 +379,10 @@ class ActorTestHarness:
                 message_or_sender, receiver, message_type, payload or {}
             )
 
-        # Handle new interface (message dictionary)
+        # Handle new interface (message dictionary or Message)
         message = message_or_sender
+        if isinstance(message, Message):
+            message = message.to_dict()
 
         # Validate message
         if not message.get("sender") or not message.get("receiver"):
@@ -213,6 +391,11 @@ class ActorTestHarness:
         if message.get("payload") is None:
             return {"error": "invalid_payload"}
 
+        if to is not None:
+            self._record_message(message)
+            await to.tell(MappingProxyType(message))
+            return {"status": "sent"}
+
         receiver_name = message.get("receiver")
 
         # Check for invalid recipient
@@ -228,6 +411,7 @@ class ActorTestHarness:
                         "error": "recipient_not_found",
                     },
                 }
+                self._errors_by_original_id[message.get("id")] = error_msg
                 await self.actors[message.get("sender")].tell(error_msg)
             return {"error": "recipient_not_found"}
 
@@ -242,32 +426,76 @@ class ActorTestHarness:
 
         # Handle broadcast
         if receiver_name == "BROADCAST":
-            for actor_name, actor in self.actors.items():
-                if actor_name != message.get("sender"):
-                    await actor.tell(message)
-                    self._actor_messages[actor_name].append(message)
+            await self._broadcast(message)
         else:
-            # Send to specific actor
-            await self.actors[receiver_name].tell(message)
+            # Recipients only read messages, so hand over a read-only view
+            await self.actors[receiver_name].tell(MappingProxyType(message))
 
         return {"status": "sent"}
 
+    async def _broadcast(self, message: Dict[str, Any]) -> None:
+        """
+        Deliver a message once to every actor, sharing one read-only view.
+
+        Every actor except the sender is told, which runs its handlers and logs
+        the delivery. The sender only gets a copy in its mailbox.
+        """
+        frozen = MappingProxyType(message)
+        sender = message.get("sender")
+        for actor_name, actor in list(self.actors.items()):
+            if actor_name == sender:
+                actor.mailbox.append(frozen)
+                self._track_delivery(actor_name, frozen)
+            else:
+                await actor.tell(frozen)
+
+    async def send_batch(
+        self,
+        messages: List[Union[Dict[str, Any], Message]],
+        to: Optional[Mock] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send messages one after another, preserving their order.
+
+        Returns:
+            One send result per message, in the same order
+        """
+        return [await self.send_message(message, to=to) for message in messages]
+
     async def send_message_with_ack(
-        self, message: Dict[str, Any], timeout: float = 1.0
+        self, message: Union[Dict[str, Any], Message], timeout: float = 1.0
     ) -> Optional[Dict[str, Any]]:
         """Send message and wait for acknowledgment"""
+        if isinstance(message, Message):
+            message = message.to_dict()
+
+        receiver = message.get("receiver")
+
+        # An unknown recipient can never acknowledge, so don't spend the timeout
+        if receiver not in self.actors and receiver != "BROADCAST":
+            return {
+                "message_id": message.get("id"),
+                "status": "timeout",
+                "reason": "unknown_recipient",
+            }
+
         result = await self.send_message(message)
 
         if result and result.get("error"):
             return None
 
-        # Simulate acknowledgment
-        await asyncio.sleep(0.1)  # Small delay
+        # A broadcast is sent, but no single receiver acknowledges it
+        if receiver == "BROADCAST":
+            return {"message_id": message.get("id"), "status": "timeout"}
 
-        if message.get("receiver") in self.actors:
-            return {"message_id": message.get("id"), "status": "delivered"}
-        else:
-            return {"status": "timeout"}
+        try:
+            await self.wait_for_delivery(
+                message["receiver"], message.get("type"), timeout
+            )
+        except TimeoutError:
+            return {"message_id": message.get("id"), "status": "timeout"}
+
+        return {"message_id": message.get("id"), "status": "delivered"}
 
     async def send_message_with_retry(
         self, message: Dict[str, Any], retry_config: Dict[str, Any]
@@ -280,13 +508,13 @@ class ActorTestHarness:
             result = await self.send_message(message)
             if result and not result.get("error"):
                 return {"delivered": True, "attempts": attempt}
-            await asyncio.sleep(retry_delay)
+            await self._sleep(retry_delay)
 
         return {"delivered": False, "attempts": max_retries}
 
     def get_actor_messages(self, actor_name: str) -> List[Dict[str, Any]]:
-        """Get all messages received by an actor"""
-        return self._actor_messages.get(actor_name, [])
+        """Get a copy of the messages received by an actor"""
+        return list(self._actor_messages.get(actor_name, ()))
 
     async def restart_actor(self, actor_name: str) -> None:
         """Restart an actor"""
@@ -349,11 +577,13 @@ class ActorTestHarness:
     async def send_request(
         self, request: Dict[str, Any], timeout: float = 1.0
     ) -> Optional[Dict[str, Any]]:
-        """Send request and wait for response"""
+        """Send request and wait for response, or None if it is not delivered"""
         await self.send_message(request)
 
-        # Simulate response
-        await asyncio.sleep(0.1)
+        try:
+            await self.wait_for_delivery(request["receiver"], request["type"], timeout)
+        except TimeoutError:
+            return None
 
         return {
             "request_id": request.get("id"),
@@ -508,9 +738,10 @@ class ActorTestHarness:
         """Clear the message log"""
         self.message_log.clear()
         self.messages.clear()
-        # Reinitialize actor messages instead of clearing completely
-        for actor_name in self.actors:
-            self._actor_messages[actor_name] = []
+        # Empty mailboxes in place so actor refs held by tests stay valid
+        for actor in self.actors.values():
+            actor.mailbox.clear()
+        self._clear_indexes()
         for actor in self.actors.values():
             actor.received_messages.clear()
             if hasattr(actor, "sent_messages"):
@@ -530,20 +761,13 @@ class ActorTestHarness:
         Returns:
             The message if received, None if timeout
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            messages = self.get_actor_messages(actor_name)
-            for message in reversed(messages):  # Check newest first
-                if (
-                    message.get("type") == message_type
-                    or message.get("message_type") == message_type
-                ):
-                    return message
-
-            await asyncio.sleep(0.05)  # Small delay before checking again
-
-        return None  # Timeout
+        key = (actor_name, message_type)
+        if not self._actor_messages_by_type.get(key):
+            try:
+                await self.wait_for_delivery(actor_name, message_type, timeout)
+            except TimeoutError:
+                return None
+        return self._actor_messages_by_type[key][-1]
 
     def get_received_messages(self, actor_name: str) -> List[Dict[str, Any]]:
         """Legacy method - use get_actor_messages instead"""
@@ -3,9 +3,44 @@ BACnet-related test fixtures.
 """
 
 import pytest
+from typing import Any, Dict, List
 from unittest.mock import Mock, AsyncMock
 
 
+# BACnetHealthProcessor recognizes BACnet constructed types by class name, so these
+# plain classes stand in for them without building a Mock per property
+
+
+class PriorityArray:
+    """16-slot priority array; slots missing from ``values`` are relinquished"""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Dict[int, Any]):
+        self._values = values
+
+    def __getitem__(self, index: int) -> Any:
+        return self._values.get(index)
+
+
+class LimitEnable:
+    """2-bit BitString: [lowLimitEnable, highLimitEnable]"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: List[int]):
+        self.value = value
+
+
+class EventTransitionBits:
+    """3-bit BitString: [toFault, toNormal, toOffnormal]"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: List[int]):
+        self.value = value
+
+
 @pytest.fixture
 def mock_bac0_device():
     """Mock BAC0 device"""
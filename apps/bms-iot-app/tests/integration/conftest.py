@@ -0,0 +1,41 @@
+"""
+Pytest configuration for integration tests.
+"""
+
+import time
+
+import pytest
+import pytest_asyncio
+
+from fixtures.actor_test_harness import ActorTestHarness
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_harness():
+    """One initialized harness for the whole test session"""
+    harness = ActorTestHarness()
+    await harness.initialize()
+    yield harness
+    await harness.cleanup()
+
+
+@pytest.fixture
+def harness(shared_harness):
+    """The shared harness, reset to a clean state for each test"""
+    shared_harness.reset()
+    return shared_harness
+
+
+@pytest.fixture(scope="session")
+def large_bulk_points():
+    """100 BACnet point readings, built once and shared read-only"""
+    start = time.time()
+    return [
+        {
+            "name": f"point_{i}",
+            "value": 20.0 + i * 0.1,
+            "quality": "good",
+            "timestamp": start + i,
+        }
+        for i in range(100)
+    ]
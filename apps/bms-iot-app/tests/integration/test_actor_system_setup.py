@@ -6,13 +6,8 @@ User Story: As a developer, I want to ensure the actor system initializes correc
 
 import pytest
 import asyncio
+from collections import deque
 from unittest.mock import patch
-import sys
-
-# Add the fixtures directory to the path
-sys.path.insert(
-    0, "/Users/amol/Documents/ai-projects/bms-project/apps/bms-iot-app/tests"
-)
 
 from fixtures.actor_test_harness import ActorTestHarness
 
@@ -34,7 +29,7 @@ class TestActorSystemInitialization:
 
         # Verify initial state
         assert isinstance(harness.actors, dict)
-        assert isinstance(harness.messages, list)
+        assert isinstance(harness.messages, deque)
         assert len(harness.actors) == 0
         assert len(harness.messages) == 0
 
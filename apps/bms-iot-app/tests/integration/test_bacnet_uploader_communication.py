@@ -8,26 +8,15 @@ cloud services for analysis and storage.
 import pytest
 import asyncio
 import time
-import sys
 
-# Add the fixtures directory to the path
-sys.path.insert(
-    0, "/Users/amol/Documents/ai-projects/bms-project/apps/bms-iot-app/tests"
-)
-
-from fixtures.actor_test_harness import ActorTestHarness
+pytestmark = pytest.mark.xdist_group("bacnet_uploader_communication")
 
 
 class TestBACnetToUploaderDataFlow:
     """Test BACnet monitoring to Uploader data flow"""
 
-    @pytest.mark.asyncio
-    async def test_point_data_upload_request(self):
+    async def test_point_data_upload_request(self, harness):
         """Test: BACnet sends point data to Uploader for cloud storage"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # BACnet collects and sends data for upload
         upload_request = {
             "type": "DATA_UPLOAD_REQUEST",
@@ -85,15 +74,8 @@ class TestBACnetToUploaderDataFlow:
         assert temp_point["value"] == 23.5
         assert temp_point["unit"] == "celsius"
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_bulk_data_upload(self):
+    async def test_bulk_data_upload(self, harness):
         """Test: BACnet sends bulk historical data to Uploader"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Create bulk historical data
         current_time = time.time()
         bulk_upload = {
@@ -132,10 +114,7 @@ class TestBACnetToUploaderDataFlow:
         await asyncio.sleep(0.1)
 
         # Verify Uploader received bulk data
-        uploader_messages = harness.get_actor_messages("uploader")
-        bulk_msg = next(
-            (m for m in uploader_messages if m["type"] == "BULK_DATA_UPLOAD"), None
-        )
+        bulk_msg = harness.first_by_type("uploader", "BULK_DATA_UPLOAD")
 
         assert bulk_msg is not None
         assert bulk_msg["payload"]["total_points"] == 60
@@ -146,15 +125,8 @@ class TestBACnetToUploaderDataFlow:
         assert "temperature" in first_point["values"]
         assert "humidity" in first_point["values"]
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_aggregated_data_upload(self):
+    async def test_aggregated_data_upload(self, harness):
         """Test: BACnet sends aggregated/computed data to Uploader"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Send aggregated statistics
         aggregated_data = {
             "type": "AGGREGATED_DATA_UPLOAD",
@@ -198,11 +170,7 @@ class TestBACnetToUploaderDataFlow:
         await asyncio.sleep(0.1)
 
         # Verify aggregated data was received
-        uploader_messages = harness.get_actor_messages("uploader")
-        agg_msg = next(
-            (m for m in uploader_messages if m["type"] == "AGGREGATED_DATA_UPLOAD"),
-            None,
-        )
+        agg_msg = harness.first_by_type("uploader", "AGGREGATED_DATA_UPLOAD")
 
         assert agg_msg is not None
         assert agg_msg["payload"]["aggregation_period"] == "15_minutes"
@@ -210,15 +178,8 @@ class TestBACnetToUploaderDataFlow:
         assert agg_msg["payload"]["statistics"]["temperature"]["avg"] == 23.1
         assert agg_msg["payload"]["quality_metrics"]["data_completeness"] == 0.98
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_alarm_event_upload(self):
+    async def test_alarm_event_upload(self, harness):
         """Test: BACnet sends alarm/event data to Uploader"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Send alarm event for upload
         alarm_event = {
             "type": "ALARM_EVENT_UPLOAD",
@@ -252,29 +213,19 @@ class TestBACnetToUploaderDataFlow:
         await asyncio.sleep(0.1)
 
         # Verify alarm was uploaded
-        uploader_messages = harness.get_actor_messages("uploader")
-        alarm_msg = next(
-            (m for m in uploader_messages if m["type"] == "ALARM_EVENT_UPLOAD"), None
-        )
+        alarm_msg = harness.first_by_type("uploader", "ALARM_EVENT_UPLOAD")
 
         assert alarm_msg is not None
         assert alarm_msg["payload"]["alarm_details"]["severity"] == "critical"
         assert alarm_msg["payload"]["alarm_details"]["trigger_value"] == 35.2
         assert alarm_msg["payload"]["requires_immediate_upload"] is True
 
-        await harness.cleanup()
-
 
 class TestUploaderToBACnetResponses:
     """Test Uploader responses back to BACnet monitoring"""
 
-    @pytest.mark.asyncio
-    async def test_upload_success_confirmation(self):
+    async def test_upload_success_confirmation(self, harness):
         """Test: Uploader confirms successful data upload to BACnet"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Step 1: BACnet sends data
         upload_request = {
             "id": "upload_001",
@@ -310,25 +261,15 @@ class TestUploaderToBACnetResponses:
         await asyncio.sleep(0.1)
 
         # Verify confirmation flow
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        confirm_msg = next(
-            (m for m in bacnet_messages if m["type"] == "UPLOAD_CONFIRMATION"), None
-        )
+        confirm_msg = harness.first_by_type("bacnet_monitoring", "UPLOAD_CONFIRMATION")
 
         assert confirm_msg is not None
         assert confirm_msg["payload"]["status"] == "success"
         assert confirm_msg["payload"]["original_request_id"] == "upload_001"
         assert "storage_location" in confirm_msg["payload"]
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_upload_failure_notification(self):
+    async def test_upload_failure_notification(self, harness):
         """Test: Uploader notifies BACnet of upload failures"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Uploader reports failure
         upload_failure = {
             "type": "UPLOAD_FAILURE",
@@ -355,25 +296,15 @@ class TestUploaderToBACnetResponses:
         await asyncio.sleep(0.1)
 
         # Verify failure notification
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        failure_msg = next(
-            (m for m in bacnet_messages if m["type"] == "UPLOAD_FAILURE"), None
-        )
+        failure_msg = harness.first_by_type("bacnet_monitoring", "UPLOAD_FAILURE")
 
         assert failure_msg is not None
         assert failure_msg["payload"]["failure_reason"] == "network_timeout"
         assert failure_msg["payload"]["data_buffered"] is True
         assert failure_msg["payload"]["retry_recommended"] is True
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_upload_quota_exceeded(self):
+    async def test_upload_quota_exceeded(self, harness):
         """Test: Uploader notifies BACnet when upload quota is exceeded"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Uploader reports quota exceeded
         quota_exceeded = {
             "type": "UPLOAD_QUOTA_EXCEEDED",
@@ -402,24 +333,14 @@ class TestUploaderToBACnetResponses:
         await asyncio.sleep(0.1)
 
         # Verify quota notification
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        quota_msg = next(
-            (m for m in bacnet_messages if m["type"] == "UPLOAD_QUOTA_EXCEEDED"), None
-        )
+        quota_msg = harness.first_by_type("bacnet_monitoring", "UPLOAD_QUOTA_EXCEEDED")
 
         assert quota_msg is not None
         assert quota_msg["payload"]["quota_type"] == "daily_data_limit"
         assert quota_msg["payload"]["action_taken"] == "data_buffered"
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_upload_statistics_report(self):
+    async def test_upload_statistics_report(self, harness):
         """Test: Uploader sends periodic statistics to BACnet"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Uploader sends statistics report
         stats_report = {
             "type": "UPLOAD_STATISTICS",
@@ -454,10 +375,7 @@ class TestUploaderToBACnetResponses:
         await asyncio.sleep(0.1)
 
         # Verify statistics received
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        stats_msg = next(
-            (m for m in bacnet_messages if m["type"] == "UPLOAD_STATISTICS"), None
-        )
+        stats_msg = harness.first_by_type("bacnet_monitoring", "UPLOAD_STATISTICS")
 
         assert stats_msg is not None
         assert "BAC_DEVICE_001" in stats_msg["payload"]["device_statistics"]
@@ -467,19 +385,12 @@ class TestUploaderToBACnetResponses:
         )
         assert stats_msg["payload"]["overall_statistics"]["api_health"] == "healthy"
 
-        await harness.cleanup()
-
 
 class TestDataBufferingAndRetry:
     """Test data buffering and retry mechanisms"""
 
-    @pytest.mark.asyncio
-    async def test_data_buffering_during_outage(self):
+    async def test_data_buffering_during_outage(self, harness):
         """Test: Data buffering when uploader is unavailable"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # BACnet notifies about buffering
         buffer_notification = {
             "type": "DATA_BUFFERING_STARTED",
@@ -534,23 +445,14 @@ class TestDataBufferingAndRetry:
 
         # Verify buffering flow
         uploader_messages = harness.get_actor_messages("uploader")
-        buffer_start = next(
-            (m for m in uploader_messages if m["type"] == "DATA_BUFFERING_STARTED"),
-            None,
-        )
+        buffer_start = harness.first_by_type("uploader", "DATA_BUFFERING_STARTED")
         assert buffer_start is not None
 
         buffered_msgs = [m for m in uploader_messages if m["type"] == "BUFFERED_DATA"]
         assert len(buffered_msgs) == 5
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_retry_with_exponential_backoff(self):
+    async def test_retry_with_exponential_backoff(self, harness):
         """Test: Retry uploads with exponential backoff"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
         # Configure retry with exponential backoff
         retry_config = {
             "max_retries": 5,
@@ -592,15 +494,8 @@ class TestDataBufferingAndRetry:
             if "retry_delay" in msg:
                 assert msg["retry_delay"] == expected_delays[i]
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_batch_upload_optimization(self):
+    async def test_batch_upload_optimization(self, harness):
         """Test: Batch multiple small uploads for efficiency"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # BACnet sends request to batch uploads
         batch_request = {
             "type": "BATCH_UPLOAD_REQUEST",
@@ -652,38 +547,26 @@ class TestDataBufferingAndRetry:
         await asyncio.sleep(0.1)
 
         # Verify batch optimization
-        uploader_messages = harness.get_actor_messages("uploader")
-        batch_msg = next(
-            (m for m in uploader_messages if m["type"] == "BATCH_UPLOAD_REQUEST"), None
-        )
+        batch_msg = harness.first_by_type("uploader", "BATCH_UPLOAD_REQUEST")
 
         assert batch_msg is not None
         assert batch_msg["payload"]["total_items"] == 20
         assert batch_msg["payload"]["batch_strategy"] == "time_window"
 
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        confirm_msg = next(
-            (m for m in bacnet_messages if m["type"] == "BATCH_UPLOAD_CONFIRMATION"),
-            None,
+        confirm_msg = harness.first_by_type(
+            "bacnet_monitoring", "BATCH_UPLOAD_CONFIRMATION"
         )
 
         assert confirm_msg is not None
         assert confirm_msg["payload"]["items_uploaded"] == 20
         assert confirm_msg["payload"]["storage_saved_percent"] == 35
 
-        await harness.cleanup()
-
 
 class TestDataTransformationAndCompression:
     """Test data transformation and compression between actors"""
 
-    @pytest.mark.asyncio
-    async def test_data_compression_before_upload(self):
+    async def test_data_compression_before_upload(self, harness):
         """Test: BACnet compresses data before sending to Uploader"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Large dataset for compression
         large_dataset = {
             "type": "COMPRESSED_DATA_UPLOAD",
@@ -710,25 +593,14 @@ class TestDataTransformationAndCompression:
         await asyncio.sleep(0.1)
 
         # Verify compressed data received
-        uploader_messages = harness.get_actor_messages("uploader")
-        compressed_msg = next(
-            (m for m in uploader_messages if m["type"] == "COMPRESSED_DATA_UPLOAD"),
-            None,
-        )
+        compressed_msg = harness.first_by_type("uploader", "COMPRESSED_DATA_UPLOAD")
 
         assert compressed_msg is not None
         assert compressed_msg["payload"]["compression"]["algorithm"] == "gzip"
         assert compressed_msg["payload"]["compression"]["compression_ratio"] == 0.244
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_data_format_transformation(self):
+    async def test_data_format_transformation(self, harness):
         """Test: Data format transformation between BACnet and Uploader"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # BACnet sends data in one format
         bacnet_format_data = {
             "type": "DATA_TRANSFORM_REQUEST",
@@ -789,34 +661,22 @@ class TestDataTransformationAndCompression:
         await asyncio.sleep(0.1)
 
         # Verify transformation flow
-        uploader_messages = harness.get_actor_messages("uploader")
-        transform_req = next(
-            (m for m in uploader_messages if m["type"] == "DATA_TRANSFORM_REQUEST"),
-            None,
-        )
+        transform_req = harness.first_by_type("uploader", "DATA_TRANSFORM_REQUEST")
 
         assert transform_req is not None
         assert transform_req["payload"]["source_format"] == "bacnet_raw"
         assert transform_req["payload"]["target_format"] == "cloud_json"
 
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        transform_complete = next(
-            (m for m in bacnet_messages if m["type"] == "DATA_TRANSFORM_COMPLETE"), None
+        transform_complete = harness.first_by_type(
+            "bacnet_monitoring", "DATA_TRANSFORM_COMPLETE"
         )
 
         assert transform_complete is not None
         assert transform_complete["payload"]["transformation_status"] == "success"
         assert transform_complete["payload"]["records_transformed"] == 3
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_data_validation_before_upload(self):
+    async def test_data_validation_before_upload(self, harness):
         """Test: Data validation between BACnet and Uploader"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # BACnet sends data for validation
         data_for_validation = {
             "type": "VALIDATE_DATA_REQUEST",
@@ -884,37 +744,24 @@ class TestDataTransformationAndCompression:
         await asyncio.sleep(0.1)
 
         # Verify validation flow
-        uploader_messages = harness.get_actor_messages("uploader")
-        validation_req = next(
-            (m for m in uploader_messages if m["type"] == "VALIDATE_DATA_REQUEST"), None
-        )
+        validation_req = harness.first_by_type("uploader", "VALIDATE_DATA_REQUEST")
 
         assert validation_req is not None
         assert len(validation_req["payload"]["data"]) == 3
 
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        validation_res = next(
-            (m for m in bacnet_messages if m["type"] == "VALIDATION_RESULT"), None
-        )
+        validation_res = harness.first_by_type("bacnet_monitoring", "VALIDATION_RESULT")
 
         assert validation_res is not None
         assert validation_res["payload"]["validation_status"] == "partial_failure"
         assert validation_res["payload"]["invalid_records"] == 2
         assert len(validation_res["payload"]["validation_errors"]) == 2
 
-        await harness.cleanup()
-
 
 class TestCloudServiceIntegration:
     """Test cloud service integration patterns"""
 
-    @pytest.mark.asyncio
-    async def test_multi_cloud_upload_routing(self):
+    async def test_multi_cloud_upload_routing(self, harness):
         """Test: Route uploads to different cloud services"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # BACnet requests multi-cloud upload
         multi_cloud_request = {
             "type": "MULTI_CLOUD_UPLOAD",
@@ -987,19 +834,14 @@ class TestCloudServiceIntegration:
         await asyncio.sleep(0.1)
 
         # Verify multi-cloud routing
-        uploader_messages = harness.get_actor_messages("uploader")
-        multi_req = next(
-            (m for m in uploader_messages if m["type"] == "MULTI_CLOUD_UPLOAD"), None
-        )
+        multi_req = harness.first_by_type("uploader", "MULTI_CLOUD_UPLOAD")
 
         assert multi_req is not None
         assert len(multi_req["payload"]["destinations"]) == 3
         assert multi_req["payload"]["routing_strategy"] == "data_type_based"
 
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        multi_res = next(
-            (m for m in bacnet_messages if m["type"] == "MULTI_CLOUD_UPLOAD_RESULT"),
-            None,
+        multi_res = harness.first_by_type(
+            "bacnet_monitoring", "MULTI_CLOUD_UPLOAD_RESULT"
         )
 
         assert multi_res is not None
@@ -1007,5 +849,3 @@ class TestCloudServiceIntegration:
         assert all(
             r["status"] == "success" for r in multi_res["payload"]["upload_results"]
         )
-
-        await harness.cleanup()
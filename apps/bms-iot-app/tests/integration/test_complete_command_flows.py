@@ -8,14 +8,8 @@ work correctly from initiation through all actors to completion.
 import pytest
 import asyncio
 import time
-import sys
 import uuid
 
-# Add the fixtures directory to the path
-sys.path.insert(
-    0, "/Users/amol/Documents/ai-projects/bms-project/apps/bms-iot-app/tests"
-)
-
 from fixtures.actor_test_harness import ActorTestHarness
 
 
@@ -6,7 +6,6 @@ sqlalchemy.exc.TimeoutError: QueuePool limit of size 1 overflow 0 reached
 
 import asyncio
 import pytest
-import pytest_asyncio
 import time
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
@@ -18,36 +17,11 @@ from src.models.controller_points import get_points_to_upload
 from src.models.device_status_enums import MonitoringStatusEnum
 from src.network.sqlmodel_client import (
     get_session,
-    initialize_database,
     DATABASE_URL,
     connect_args,
 )
 
 
-# Global setup for tests
-@pytest_asyncio.fixture(scope="session", autouse=True)
-async def setup_database():
-    """Initialize database tables before running tests"""
-    try:
-        # Import all models to ensure they're registered with SQLModel
-
-        # Import all models and create tables using SQLModel metadata
-        from sqlmodel import SQLModel
-        from src.network.sqlmodel_client import get_engine
-
-        # Create all tables using SQLModel metadata
-        engine = get_engine()
-        async with engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
-
-        # Initialize database optimizations
-        await initialize_database()
-        print("Test database initialized successfully")
-    except Exception as e:
-        print(f"Test database initialization failed: {e}")
-        raise
-
-
 class TestConnectionPoolTimeout:
     """Test connection pool timeout scenarios"""
 
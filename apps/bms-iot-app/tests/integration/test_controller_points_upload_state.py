@@ -0,0 +1,94 @@
+"""
+Regression tests for the is_uploaded filters on controller points.
+
+get_points_to_upload and delete_uploaded_points used to compare the column with
+Python's `is`, which compiled to WHERE false: no point was ever handed to the
+uploader and no uploaded point was ever deleted. These run against the real
+test database so the compiled SQL is exercised.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlmodel import select
+
+from src.models.bacnet_types import BacnetObjectTypeEnum
+from src.models.controller_points import (
+    ControllerPointsModel,
+    bulk_insert_controller_points,
+    delete_uploaded_points,
+    get_points_to_upload,
+    mark_points_as_uploaded,
+)
+from src.network.sqlmodel_client import get_session
+
+# Older than any row other tests insert, so the seeded pending points sort into
+# the first page get_points_to_upload returns
+SEED_CREATED_AT = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+async def _seed_points(controller_id: str) -> list[ControllerPointsModel]:
+    """Insert two pending and two uploaded points for one controller."""
+    points = [
+        ControllerPointsModel(
+            controller_ip_address="192.168.1.150",
+            bacnet_object_type=BacnetObjectTypeEnum.ANALOG_INPUT,
+            point_id=i,
+            iot_device_point_id=f"{controller_id}_point_{i}",
+            controller_id=controller_id,
+            controller_device_id=f"{controller_id}_device",
+            present_value=str(i),
+            is_uploaded=i >= 2,
+            created_at=SEED_CREATED_AT,
+        )
+        for i in range(4)
+    ]
+    await bulk_insert_controller_points(points)
+    return points
+
+
+async def _points_for_controller(controller_id: str) -> list[ControllerPointsModel]:
+    async with get_session() as session:
+        result = await session.execute(
+            select(ControllerPointsModel).where(
+                ControllerPointsModel.controller_id == controller_id
+            )
+        )
+        return list(result.scalars().all())
+
+
+class TestControllerPointsUploadState:
+    """Test the upload queue reads and deletes rows by is_uploaded"""
+
+    @pytest.mark.asyncio
+    async def test_get_points_to_upload_returns_pending_points(self):
+        """Test only points not yet uploaded are returned"""
+        points = await _seed_points("upload_state_pending")
+
+        pending = await get_points_to_upload()
+
+        assert pending, "Expected pending points to be returned"
+        assert all(not point.is_uploaded for point in pending)
+        pending_ids = {point.id for point in pending}
+        assert {points[0].id, points[1].id} <= pending_ids
+        assert not {points[2].id, points[3].id} & pending_ids
+
+        # Leave no old pending rows at the front of the queue for later tests
+        await mark_points_as_uploaded(points[:2])
+        await delete_uploaded_points()
+
+    @pytest.mark.asyncio
+    async def test_delete_uploaded_points_removes_uploaded_points(self):
+        """Test only uploaded points are deleted"""
+        points = await _seed_points("upload_state_delete")
+
+        deleted_count = await delete_uploaded_points()
+
+        assert deleted_count >= 2
+        remaining = await _points_for_controller("upload_state_delete")
+        assert {point.id for point in remaining} == {points[0].id, points[1].id}
+        assert all(not point.is_uploaded for point in remaining)
+
+        await mark_points_as_uploaded(remaining)
+        await delete_uploaded_points()
+        assert await _points_for_controller("upload_state_delete") == []
@@ -8,12 +8,6 @@ and recover automatically without data loss.
 import pytest
 import asyncio
 import time
-import sys
-
-# Add the fixtures directory to the path
-sys.path.insert(
-    0, "/Users/amol/Documents/ai-projects/bms-project/apps/bms-iot-app/tests"
-)
 
 from fixtures.actor_test_harness import ActorTestHarness
 
@@ -507,6 +501,7 @@ class TestCascadingFailurePrevention:
         await asyncio.sleep(0.1)
 
         # Verify recovery notification
+        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
         recovery_msg = next(
             (m for m in bacnet_messages if m["type"] == "CIRCUIT_BREAKER_CLOSED"), None
         )
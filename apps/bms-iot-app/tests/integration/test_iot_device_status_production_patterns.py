@@ -4,8 +4,9 @@ Tests how actors and main.py use upsert_iot_device_status in real scenarios.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-import time
+from uuid import uuid4
 
 from src.models.iot_device_status import (
     upsert_iot_device_status,
@@ -14,6 +15,56 @@ from src.models.iot_device_status import (
 )
 from src.models.device_status_enums import MonitoringStatusEnum, ConnectionStatusEnum
 
+_ACTIVE = MonitoringStatusEnum.ACTIVE
+_ERROR = MonitoringStatusEnum.ERROR
+_INIT = MonitoringStatusEnum.INITIALIZING
+_CONN = ConnectionStatusEnum.CONNECTED
+_DISC = ConnectionStatusEnum.DISCONNECTED
+
+BASE_ACTIVE_STATUS = {
+    "organization_id": "test-org",
+    "site_id": "test-site",
+    "monitoring_status": _ACTIVE,
+}
+
+PREWARMED_DEVICE_PREFIXES = (
+    "bacnet-conn",
+    "mqtt-conn",
+    "system-metrics",
+    "concurrent-actors",
+)
+
+
+def _unique_device_id(prefix: str) -> str:
+    """Device id that no other test or xdist worker will reuse"""
+    return f"{prefix}-{uuid4().hex[:12]}"
+
+
+@pytest_asyncio.fixture(scope="module")
+async def prewarmed_device_ids():
+    """Create the active devices that tests start from in one concurrent batch"""
+    device_ids = {
+        prefix: _unique_device_id(prefix) for prefix in PREWARMED_DEVICE_PREFIXES
+    }
+    await asyncio.gather(
+        *(
+            upsert_iot_device_status(device_id, dict(BASE_ACTIVE_STATUS))
+            for device_id in device_ids.values()
+        )
+    )
+    return device_ids
+
+
+@pytest.fixture
+def prewarmed_device_id(request, prewarmed_device_ids):
+    """
+    Device already created with BASE_ACTIVE_STATUS.
+
+    Request it with indirect parametrization naming one of
+    PREWARMED_DEVICE_PREFIXES.
+    """
+    return prewarmed_device_ids[request.param]
+
 
 # Database setup is now handled by global conftest.py fixture
 
@@ -21,13 +72,12 @@ from src.models.device_status_enums import MonitoringStatusEnum, ConnectionStatu
 class TestBacnetMonitoringActorPatterns:
     """Test patterns used by BacnetMonitoringActor"""
 
-    @pytest.mark.asyncio
     async def test_monitoring_status_update_pattern(self):
         """Test the pattern used in BacnetMonitoringActor.update_monitoring_status"""
-        device_id = f"bacnet-monitoring-{int(time.time())}"
+        device_id = _unique_device_id("bacnet-monitoring")
 
         # Simulate BacnetMonitoringActor pattern for updating monitoring status
-        status = MonitoringStatusEnum.ACTIVE
+        status = _ACTIVE
         status_data = {
             "organization_id": "test-org",
             "site_id": "test-site",
@@ -36,26 +86,23 @@ class TestBacnetMonitoringActorPatterns:
 
         result = await upsert_iot_device_status(device_id, status_data)
 
-        assert result is not None
         assert result.iot_device_id == device_id
         assert result.monitoring_status == status
 
         # Test transitioning to ERROR state
-        error_status_data = {"monitoring_status": MonitoringStatusEnum.ERROR}
+        error_status_data = {"monitoring_status": _ERROR}
 
         error_result = await upsert_iot_device_status(device_id, error_status_data)
 
-        assert error_result is not None
         assert error_result.iot_device_id == device_id
-        assert error_result.monitoring_status == MonitoringStatusEnum.ERROR
+        assert error_result.monitoring_status == _ERROR
         # Should preserve other fields
         assert error_result.organization_id == "test-org"
         assert error_result.site_id == "test-site"
 
-    @pytest.mark.asyncio
     async def test_bacnet_status_update_pattern(self):
         """Test the pattern used in BacnetMonitoringActor.update_bacnet_status"""
-        device_id = f"bacnet-status-{int(time.time())}"
+        device_id = _unique_device_id("bacnet-status")
 
         # Simulate the pattern from update_bacnet_status
         bacnet_readers = ["192.168.1.100", "192.168.1.101"]  # Mock readers
@@ -63,95 +110,67 @@ class TestBacnetMonitoringActorPatterns:
             "organization_id": "test-org",
             "site_id": "test-site",
             "bacnet_devices_connected": len(bacnet_readers),  # Use correct field name
-            "bacnet_connection_status": ConnectionStatusEnum.CONNECTED,
+            "bacnet_connection_status": _CONN,
         }
 
         result = await upsert_iot_device_status(device_id, status_data)
 
-        assert result is not None
         assert result.iot_device_id == device_id
         assert result.bacnet_devices_connected == 2  # Use correct field name
-        assert result.bacnet_connection_status == ConnectionStatusEnum.CONNECTED
+        assert result.bacnet_connection_status == _CONN
 
-    @pytest.mark.asyncio
-    async def test_bacnet_connection_status_update_pattern(self):
+    @pytest.mark.parametrize("prewarmed_device_id", ["bacnet-conn"], indirect=True)
+    async def test_bacnet_connection_status_update_pattern(self, prewarmed_device_id):
         """Test the pattern used in BacnetMonitoringActor.update_bacnet_connection_status"""
-        device_id = f"bacnet-conn-{int(time.time())}"
-
-        # First create device with required fields
-        initial_data = {
-            "organization_id": "test-org",
-            "site_id": "test-site",
-            "monitoring_status": MonitoringStatusEnum.ACTIVE,
-        }
-        await upsert_iot_device_status(device_id, initial_data)
+        device_id = prewarmed_device_id
 
         # Test CONNECTED status
-        connected_status_data = {
-            "bacnet_connection_status": ConnectionStatusEnum.CONNECTED
-        }
+        connected_status_data = {"bacnet_connection_status": _CONN}
 
         result = await upsert_iot_device_status(device_id, connected_status_data)
 
-        assert result is not None
         assert result.iot_device_id == device_id
-        assert result.bacnet_connection_status == ConnectionStatusEnum.CONNECTED
+        assert result.bacnet_connection_status == _CONN
 
         # Test transitioning to DISCONNECTED
-        disconnected_status_data = {
-            "bacnet_connection_status": ConnectionStatusEnum.DISCONNECTED
-        }
+        disconnected_status_data = {"bacnet_connection_status": _DISC}
 
         result = await upsert_iot_device_status(device_id, disconnected_status_data)
 
-        assert result is not None
-        assert result.bacnet_connection_status == ConnectionStatusEnum.DISCONNECTED
+        assert result.bacnet_connection_status == _DISC
 
 
 class TestMQTTActorPatterns:
     """Test patterns used by MQTTActor"""
 
-    @pytest.mark.asyncio
-    async def test_mqtt_connection_status_update_pattern(self):
+    @pytest.mark.parametrize("prewarmed_device_id", ["mqtt-conn"], indirect=True)
+    async def test_mqtt_connection_status_update_pattern(self, prewarmed_device_id):
         """Test the pattern used in MQTTActor.update_mqtt_connection_status"""
-        device_id = f"mqtt-conn-{int(time.time())}"
-
-        # First create device with required fields
-        initial_data = {
-            "organization_id": "test-org",
-            "site_id": "test-site",
-            "monitoring_status": MonitoringStatusEnum.ACTIVE,
-        }
-        await upsert_iot_device_status(device_id, initial_data)
+        device_id = prewarmed_device_id
 
         # Test CONNECTED status (pattern from MQTTActor)
-        status = ConnectionStatusEnum.CONNECTED
+        status = _CONN
         status_data = {"mqtt_connection_status": status}
 
         result = await upsert_iot_device_status(device_id, status_data)
 
-        assert result is not None
         assert result.iot_device_id == device_id
         assert result.mqtt_connection_status == status
 
         # Test transitioning to DISCONNECTED
-        disconnect_status_data = {
-            "mqtt_connection_status": ConnectionStatusEnum.DISCONNECTED
-        }
+        disconnect_status_data = {"mqtt_connection_status": _DISC}
 
         result = await upsert_iot_device_status(device_id, disconnect_status_data)
 
-        assert result is not None
-        assert result.mqtt_connection_status == ConnectionStatusEnum.DISCONNECTED
+        assert result.mqtt_connection_status == _DISC
 
 
 class TestMainAppInitializationPatterns:
     """Test patterns used in main.py for app initialization"""
 
-    @pytest.mark.asyncio
     async def test_main_app_initialization_pattern(self):
         """Test the pattern used in main.py for initializing device status"""
-        device_id = f"main-init-{int(time.time())}"
+        device_id = _unique_device_id("main-init")
 
         # Simulate the pattern from main.py initialization
         organization_id = "test-org-main"
@@ -160,32 +179,30 @@ class TestMainAppInitializationPatterns:
         status_data = {
             "organization_id": organization_id,
             "site_id": site_id,
-            "monitoring_status": MonitoringStatusEnum.INITIALIZING,
-            "mqtt_connection_status": ConnectionStatusEnum.DISCONNECTED,
-            "bacnet_connection_status": ConnectionStatusEnum.DISCONNECTED,
+            "monitoring_status": _INIT,
+            "mqtt_connection_status": _DISC,
+            "bacnet_connection_status": _DISC,
         }
 
         result = await upsert_iot_device_status(device_id, status_data)
 
-        assert result is not None
         assert result.iot_device_id == device_id
         assert result.organization_id == organization_id
         assert result.site_id == site_id
-        assert result.monitoring_status == MonitoringStatusEnum.INITIALIZING
-        assert result.mqtt_connection_status == ConnectionStatusEnum.DISCONNECTED
-        assert result.bacnet_connection_status == ConnectionStatusEnum.DISCONNECTED
+        assert result.monitoring_status == _INIT
+        assert result.mqtt_connection_status == _DISC
+        assert result.bacnet_connection_status == _DISC
 
         # Simulate transitioning to ACTIVE after successful initialization
         active_status_data = {
-            "monitoring_status": MonitoringStatusEnum.ACTIVE,
-            "mqtt_connection_status": ConnectionStatusEnum.CONNECTED,
+            "monitoring_status": _ACTIVE,
+            "mqtt_connection_status": _CONN,
         }
 
         active_result = await upsert_iot_device_status(device_id, active_status_data)
 
-        assert active_result is not None
-        assert active_result.monitoring_status == MonitoringStatusEnum.ACTIVE
-        assert active_result.mqtt_connection_status == ConnectionStatusEnum.CONNECTED
+        assert active_result.monitoring_status == _ACTIVE
+        assert active_result.mqtt_connection_status == _CONN
         # Should preserve initialization values
         assert active_result.organization_id == organization_id
         assert active_result.site_id == site_id
@@ -194,18 +211,10 @@ class TestMainAppInitializationPatterns:
 class TestSystemMetricsUpdatePatterns:
     """Test patterns for system metrics updates"""
 
-    @pytest.mark.asyncio
-    async def test_system_metrics_helper_function(self):
+    @pytest.mark.parametrize("prewarmed_device_id", ["system-metrics"], indirect=True)
+    async def test_system_metrics_helper_function(self, prewarmed_device_id):
         """Test the update_system_metrics helper function used by actors"""
-        device_id = f"system-metrics-{int(time.time())}"
-
-        # First create device with required fields
-        initial_data = {
-            "organization_id": "test-org",
-            "site_id": "test-site",
-            "monitoring_status": MonitoringStatusEnum.ACTIVE,
-        }
-        await upsert_iot_device_status(device_id, initial_data)
+        device_id = prewarmed_device_id
 
         # Test initial metrics update
         initial_metrics = {
@@ -216,7 +225,6 @@ class TestSystemMetricsUpdatePatterns:
 
         result = await update_system_metrics(device_id, initial_metrics)
 
-        assert result is not None
         assert result.iot_device_id == device_id
         assert result.cpu_usage_percent == 25.5
         assert result.memory_usage_percent == 45.2
@@ -227,7 +235,6 @@ class TestSystemMetricsUpdatePatterns:
 
         partial_result = await update_system_metrics(device_id, partial_metrics)
 
-        assert partial_result is not None
         assert partial_result.cpu_usage_percent == 85.0
         assert partial_result.memory_usage_percent == 92.1
         # Should preserve other metrics
@@ -237,10 +244,10 @@ class TestSystemMetricsUpdatePatterns:
 class TestProductionScenarioSimulation:
     """Simulate realistic production scenarios"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_full_device_lifecycle_simulation(self):
         """Simulate a complete device lifecycle from startup to active monitoring"""
-        device_id = f"lifecycle-{int(time.time())}"
+        device_id = _unique_device_id("lifecycle")
         org_id = "production-org"
         site_id = "production-site"
 
@@ -248,45 +255,41 @@ class TestProductionScenarioSimulation:
         init_data = {
             "organization_id": org_id,
             "site_id": site_id,
-            "monitoring_status": MonitoringStatusEnum.INITIALIZING,
-            "mqtt_connection_status": ConnectionStatusEnum.DISCONNECTED,
-            "bacnet_connection_status": ConnectionStatusEnum.DISCONNECTED,
+            "monitoring_status": _INIT,
+            "mqtt_connection_status": _DISC,
+            "bacnet_connection_status": _DISC,
         }
 
         init_result = await upsert_iot_device_status(device_id, init_data)
-        assert init_result is not None
-        assert init_result.monitoring_status == MonitoringStatusEnum.INITIALIZING
+        assert init_result.monitoring_status == _INIT
 
         # Step 2: MQTT connection established (MQTTActor pattern)
-        mqtt_connected_data = {"mqtt_connection_status": ConnectionStatusEnum.CONNECTED}
+        mqtt_connected_data = {"mqtt_connection_status": _CONN}
 
         mqtt_result = await upsert_iot_device_status(device_id, mqtt_connected_data)
-        assert mqtt_result is not None
-        assert mqtt_result.mqtt_connection_status == ConnectionStatusEnum.CONNECTED
+        assert mqtt_result.mqtt_connection_status == _CONN
         # Should preserve init data
         assert mqtt_result.organization_id == org_id
-        assert mqtt_result.monitoring_status == MonitoringStatusEnum.INITIALIZING
+        assert mqtt_result.monitoring_status == _INIT
 
         # Step 3: BACnet connection established (BacnetMonitoringActor pattern)
         bacnet_connected_data = {
-            "bacnet_connection_status": ConnectionStatusEnum.CONNECTED,
+            "bacnet_connection_status": _CONN,
             "bacnet_devices_connected": 3,  # Use correct field name
         }
 
         bacnet_result = await upsert_iot_device_status(device_id, bacnet_connected_data)
-        assert bacnet_result is not None
-        assert bacnet_result.bacnet_connection_status == ConnectionStatusEnum.CONNECTED
+        assert bacnet_result.bacnet_connection_status == _CONN
         assert bacnet_result.bacnet_devices_connected == 3
 
         # Step 4: System becomes active (BacnetMonitoringActor pattern)
-        active_data = {"monitoring_status": MonitoringStatusEnum.ACTIVE}
+        active_data = {"monitoring_status": _ACTIVE}
 
         active_result = await upsert_iot_device_status(device_id, active_data)
-        assert active_result is not None
-        assert active_result.monitoring_status == MonitoringStatusEnum.ACTIVE
+        assert active_result.monitoring_status == _ACTIVE
         # Should preserve all connection statuses
-        assert active_result.mqtt_connection_status == ConnectionStatusEnum.CONNECTED
-        assert active_result.bacnet_connection_status == ConnectionStatusEnum.CONNECTED
+        assert active_result.mqtt_connection_status == _CONN
+        assert active_result.bacnet_connection_status == _CONN
         assert active_result.bacnet_devices_connected == 3
 
         # Step 5: Regular system metrics updates
@@ -297,73 +300,68 @@ class TestProductionScenarioSimulation:
         }
 
         metrics_result = await update_system_metrics(device_id, metrics_data)
-        assert metrics_result is not None
         assert metrics_result.cpu_usage_percent == 45.2
         # Should preserve all previous state
-        assert metrics_result.monitoring_status == MonitoringStatusEnum.ACTIVE
-        assert metrics_result.mqtt_connection_status == ConnectionStatusEnum.CONNECTED
-        assert metrics_result.bacnet_connection_status == ConnectionStatusEnum.CONNECTED
-
-    @pytest.mark.asyncio
-    async def test_concurrent_actor_updates(self):
+        assert metrics_result.monitoring_status == _ACTIVE
+        assert metrics_result.mqtt_connection_status == _CONN
+        assert metrics_result.bacnet_connection_status == _CONN
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "prewarmed_device_id", ["concurrent-actors"], indirect=True
+    )
+    async def test_concurrent_actor_updates(self, prewarmed_device_id):
         """Test concurrent updates from multiple actors (realistic production scenario)"""
-        device_id = f"concurrent-actors-{int(time.time())}"
-
-        # First create device with required fields
-        initial_data = {
-            "organization_id": "test-org",
-            "site_id": "test-site",
-            "monitoring_status": MonitoringStatusEnum.ACTIVE,
-        }
-        await upsert_iot_device_status(device_id, initial_data)
+        device_id = prewarmed_device_id
+
+        mqtt_payloads = [{"mqtt_connection_status": _CONN} for _ in range(5)]
+        bacnet_payloads = [
+            {
+                "bacnet_connection_status": _CONN,
+                "bacnet_devices_connected": i + 1,
+            }
+            for i in range(5)
+        ]
+        metrics_payloads = [
+            {
+                "cpu_usage_percent": float(10 + i * 5),
+                "memory_usage_percent": float(20 + i * 10),
+            }
+            for i in range(5)
+        ]
 
         async def mqtt_actor_simulation():
             """Simulate MQTT actor updates"""
-            for i in range(5):
-                status_data = {
-                    "mqtt_connection_status": ConnectionStatusEnum.CONNECTED,
-                }
+            for status_data in mqtt_payloads:
                 await upsert_iot_device_status(device_id, status_data)
                 await asyncio.sleep(0.01)
 
         async def bacnet_actor_simulation():
             """Simulate BACnet monitoring actor updates"""
-            for i in range(5):
-                status_data = {
-                    "bacnet_connection_status": ConnectionStatusEnum.CONNECTED,
-                    "bacnet_devices_connected": i + 1,  # Use correct field name
-                }
+            for status_data in bacnet_payloads:
                 await upsert_iot_device_status(device_id, status_data)
                 await asyncio.sleep(0.01)
 
         async def system_metrics_simulation():
             """Simulate system metrics updates"""
-            for i in range(5):
-                metrics = {
-                    "cpu_usage_percent": float(10 + i * 5),
-                    "memory_usage_percent": float(20 + i * 10),
-                }
+            for metrics in metrics_payloads:
                 await update_system_metrics(device_id, metrics)
                 await asyncio.sleep(0.01)
 
         # Run all actor simulations concurrently
-        results = await asyncio.gather(
-            mqtt_actor_simulation(),
-            bacnet_actor_simulation(),
-            system_metrics_simulation(),
-            return_exceptions=True,
-        )
-
-        # Verify no exceptions occurred
-        exceptions = [r for r in results if isinstance(r, Exception)]
-        assert len(exceptions) == 0, f"Concurrent actor updates failed: {exceptions}"
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(mqtt_actor_simulation())
+                tg.create_task(bacnet_actor_simulation())
+                tg.create_task(system_metrics_simulation())
+        except* Exception as eg:
+            pytest.fail(f"Concurrent actor updates failed: {eg.exceptions}")
 
         # Verify final state
         final_status = await get_latest_iot_device_status(device_id)
-        assert final_status is not None
         assert final_status.iot_device_id == device_id
         # Should have data from all actors
-        assert final_status.mqtt_connection_status == ConnectionStatusEnum.CONNECTED
-        assert final_status.bacnet_connection_status == ConnectionStatusEnum.CONNECTED
+        assert final_status.mqtt_connection_status == _CONN
+        assert final_status.bacnet_connection_status == _CONN
         assert final_status.cpu_usage_percent is not None
         assert final_status.memory_usage_percent is not None
@@ -5,46 +5,59 @@ User Story: As a system architect, I want messages to route correctly between ac
 """
 
 import pytest
+from freezegun import freeze_time
 import asyncio
-import sys
-import time
+from types import MappingProxyType
+from unittest.mock import AsyncMock, call
 
-# Add the fixtures directory to the path
-sys.path.insert(
-    0, "/Users/amol/Documents/ai-projects/bms-project/apps/bms-iot-app/tests"
+from fixtures.actor_test_harness import Message
+
+FROZEN_TIME = "2024-01-01 00:00:00"
+_FIXED_TS = 1704067200.0  # FROZEN_TIME as a Unix timestamp
+
+MQTT_TO_BACNET_TPL = MappingProxyType(
+    {"sender": "mqtt", "receiver": "bacnet_monitoring"}
+)
+START_MONITORING_TPL = MappingProxyType(
+    {**MQTT_TO_BACNET_TPL, "type": "START_MONITORING_REQUEST"}
+)
+POINT_DATA_UPDATE_TPL = MappingProxyType(
+    {"type": "POINT_DATA_UPDATE", "sender": "bacnet_monitoring", "receiver": "mqtt"}
 )
+UPLOAD_COMPLETED_TPL = MappingProxyType(
+    {"type": "UPLOAD_COMPLETED", "sender": "uploader", "receiver": "mqtt"}
+)
+HEARTBEAT_TPL = MappingProxyType(
+    {"type": "HEARTBEAT_PING", "sender": "heartbeat", "receiver": "BROADCAST"}
+)
+ORDERED_MESSAGE_TPL = MappingProxyType(
+    {**MQTT_TO_BACNET_TPL, "type": "ORDERED_MESSAGE"}
+)
+BULK_MESSAGE_TPL = MappingProxyType({**MQTT_TO_BACNET_TPL, "type": "BULK_MESSAGE"})
 
-from fixtures.actor_test_harness import ActorTestHarness
+pytestmark = pytest.mark.xdist_group("message_routing")
 
 
+@freeze_time(FROZEN_TIME, real_asyncio=True)
 class TestDirectMessageRouting:
     """Test direct message routing between actors"""
 
-    @pytest.mark.asyncio
-    async def test_mqtt_to_bacnet_message_routing(self):
+    async def test_mqtt_to_bacnet_message_routing(self, harness):
         """Test: Direct message routing from MQTT to BACnet actor"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        # Enable message logging
-        harness.enable_message_logging()
-
         # Create a test message from MQTT to BACnet
-        test_message = {
-            "type": "START_MONITORING_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
-            "payload": {
+        test_message = Message(
+            **START_MONITORING_TPL,
+            payload={
                 "device_id": "test_device_123",
                 "points": ["temperature", "humidity"],
             },
-        }
+        )
 
         # Send the message
         await harness.send_message(test_message)
 
         # Wait for message processing
-        await asyncio.sleep(0.1)
+        await harness.wait_for_delivery("bacnet_monitoring", "START_MONITORING_REQUEST")
 
         # Verify message was routed
         assert len(harness.messages) > 0
@@ -54,34 +67,24 @@ class TestDirectMessageRouting:
         assert len(received_messages) > 0
         assert received_messages[0]["type"] == "START_MONITORING_REQUEST"
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_bacnet_to_mqtt_message_routing(self):
+    async def test_bacnet_to_mqtt_message_routing(self, harness):
         """Test: Direct message routing from BACnet to MQTT actor"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        harness.enable_message_logging()
-
         # Create a test message from BACnet to MQTT
-        test_message = {
-            "type": "POINT_DATA_UPDATE",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
-            "payload": {
+        test_message = Message(
+            **POINT_DATA_UPDATE_TPL,
+            payload={
                 "device_id": "test_device_123",
                 "point": "temperature",
                 "value": 25.5,
-                "timestamp": time.time(),
+                "timestamp": _FIXED_TS,
             },
-        }
+        )
 
         # Send the message
         await harness.send_message(test_message)
 
         # Wait for message processing
-        await asyncio.sleep(0.1)
+        await harness.wait_for_delivery("mqtt", "POINT_DATA_UPDATE")
 
         # Verify MQTT actor received the message
         received_messages = harness.get_actor_messages("mqtt")
@@ -89,86 +92,58 @@ class TestDirectMessageRouting:
         assert received_messages[0]["type"] == "POINT_DATA_UPDATE"
         assert received_messages[0]["payload"]["value"] == 25.5
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_uploader_to_mqtt_routing(self):
+    async def test_uploader_to_mqtt_routing(self, harness):
         """Test: Message routing from Uploader to MQTT"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        harness.enable_message_logging()
-
         # Create upload completion message
-        test_message = {
-            "type": "UPLOAD_COMPLETED",
-            "sender": "uploader",
-            "receiver": "mqtt",
-            "payload": {
+        test_message = Message(
+            **UPLOAD_COMPLETED_TPL,
+            payload={
                 "batch_id": "batch_123",
                 "records_uploaded": 100,
                 "status": "success",
             },
-        }
+        )
 
         await harness.send_message(test_message)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_delivery("mqtt", "UPLOAD_COMPLETED")
 
         # Verify routing
         received_messages = harness.get_actor_messages("mqtt")
         assert any(msg["type"] == "UPLOAD_COMPLETED" for msg in received_messages)
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_heartbeat_broadcast_routing(self):
+    async def test_heartbeat_broadcast_routing(self, harness):
         """Test: Heartbeat broadcast message routing to all actors"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        harness.enable_message_logging()
-
         # Create heartbeat broadcast message
-        test_message = {
-            "type": "HEARTBEAT_PING",
-            "sender": "heartbeat",
-            "receiver": "BROADCAST",
-            "payload": {"timestamp": time.time(), "status": "healthy"},
-        }
+        test_message = Message(
+            **HEARTBEAT_TPL,
+            payload={"timestamp": _FIXED_TS, "status": "healthy"},
+        )
 
         await harness.send_message(test_message)
-        await asyncio.sleep(0.1)
+        for actor_name in ["mqtt", "bacnet_monitoring", "uploader"]:
+            await harness.wait_for_delivery(actor_name, "HEARTBEAT_PING")
 
         # All actors should receive broadcast
         for actor_name in ["mqtt", "bacnet_monitoring", "uploader"]:
-            received_messages = harness.get_actor_messages(actor_name)
-            assert any(
-                msg["type"] == "HEARTBEAT_PING" for msg in received_messages
+            assert harness.has_message_type(
+                actor_name, "HEARTBEAT_PING"
             ), f"Actor {actor_name} did not receive broadcast"
 
-        await harness.cleanup()
-
 
+@freeze_time(FROZEN_TIME, real_asyncio=True)
 class TestMessageDeliveryConfirmation:
     """Test message delivery and acknowledgment"""
 
-    @pytest.mark.asyncio
-    async def test_message_delivery_confirmation(self):
+    async def test_message_delivery_confirmation(self, harness):
         """Test: Message delivery confirmation and acknowledgment"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        harness.enable_message_logging()
-
         # Send message with delivery confirmation required
-        test_message = {
-            "id": "msg_123",
-            "type": "CONFIG_UPDATE",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
-            "require_ack": True,
-            "payload": {"config": "new_config"},
-        }
+        test_message = Message(
+            **MQTT_TO_BACNET_TPL,
+            id="msg_123",
+            type="CONFIG_UPDATE",
+            require_ack=True,
+            payload={"config": "new_config"},
+        )
 
         # Send and wait for acknowledgment
         ack = await harness.send_message_with_ack(test_message, timeout=1.0)
@@ -177,14 +152,8 @@ class TestMessageDeliveryConfirmation:
         assert ack["message_id"] == "msg_123"
         assert ack["status"] == "delivered"
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_message_acknowledgment_timeout(self):
+    async def test_message_acknowledgment_timeout(self, harness):
         """Test: Message acknowledgment timeout handling"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
         # Send message to non-responsive actor
         test_message = {
             "id": "msg_timeout",
@@ -200,15 +169,24 @@ class TestMessageDeliveryConfirmation:
 
         assert ack is None or ack["status"] == "timeout"
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_message_delivery_retry(self):
+    async def test_message_delivery_retry(self, harness, monkeypatch):
         """Test: Message delivery retry on failure"""
-        harness = ActorTestHarness()
-        await harness.initialize()
+        fake_sleep = AsyncMock()
+        monkeypatch.setattr(harness, "_sleep", fake_sleep)
+
+        # The first deliveries fail, then the real send goes through
+        failed_deliveries = 2
+        real_send = harness.send_message
+        send_attempts = 0
 
-        harness.enable_message_logging()
+        async def flaky_send(message):
+            nonlocal send_attempts
+            send_attempts += 1
+            if send_attempts <= failed_deliveries:
+                return {"error": "delivery_failed"}
+            return await real_send(message)
+
+        monkeypatch.setattr(harness, "send_message", flaky_send)
 
         # Configure retry policy
         retry_config = {"max_retries": 3, "retry_delay": 0.1}
@@ -216,67 +194,48 @@ class TestMessageDeliveryConfirmation:
         # Send message with retry
         test_message = {
             "id": "msg_retry",
+            **MQTT_TO_BACNET_TPL,
             "type": "CRITICAL_COMMAND",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
             "payload": {"command": "restart"},
         }
 
         result = await harness.send_message_with_retry(test_message, retry_config)
 
-        assert result is not None
-        assert result["delivered"] is True
-        assert result["attempts"] <= retry_config["max_retries"]
-
-        await harness.cleanup()
+        assert result == {"delivered": True, "attempts": failed_deliveries + 1}
+        assert fake_sleep.await_count == failed_deliveries
+        assert (
+            fake_sleep.await_args_list
+            == [call(retry_config["retry_delay"])] * failed_deliveries
+        )
+        assert harness.has_message_id("bacnet_monitoring", "msg_retry")
 
 
+@freeze_time(FROZEN_TIME, real_asyncio=True)
 class TestMessageQueueHandling:
     """Test message queue handling and processing order"""
 
-    @pytest.mark.asyncio
-    async def test_message_queue_fifo_ordering(self):
+    async def test_message_queue_fifo_ordering(self, harness):
         """Test: Message queue handles messages in FIFO order"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        harness.enable_message_logging()
+        bacnet_monitoring = harness.get_actor("bacnet_monitoring")
 
         # Send multiple messages quickly
-        messages = []
-        for i in range(5):
-            msg = {
-                "id": f"msg_{i}",
-                "type": "ORDERED_MESSAGE",
-                "sender": "mqtt",
-                "receiver": "bacnet_monitoring",
-                "sequence": i,
-                "payload": {"index": i},
-            }
-            messages.append(msg)
-            await harness.send_message(msg)
+        messages = [
+            Message(
+                **ORDERED_MESSAGE_TPL, id=f"msg_{i}", sequence=i, payload={"index": i}
+            )
+            for i in range(5)
+        ]
+        await harness.send_batch(messages, to=bacnet_monitoring)
 
         # Wait for processing
-        await asyncio.sleep(0.5)
+        await harness.wait_for_delivery("bacnet_monitoring", "ORDERED_MESSAGE")
 
         # Check messages were processed in order
-        received = harness.get_actor_messages("bacnet_monitoring")
-        for i in range(len(received) - 1):
-            if received[i].get("sequence") is not None:
-                assert received[i]["sequence"] <= received[i + 1].get(
-                    "sequence", float("inf")
-                )
-
-        await harness.cleanup()
+        seqs = [m["sequence"] for m in bacnet_monitoring.mailbox if "sequence" in m]
+        assert seqs == sorted(seqs)
 
-    @pytest.mark.asyncio
-    async def test_message_queue_priority_handling(self):
+    async def test_message_queue_priority_handling(self, harness):
         """Test: High priority messages are processed first"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        harness.enable_message_logging()
-
         # Send messages with different priorities
         messages = [
             {"id": "1", "priority": "low", "type": "LOW_PRIORITY"},
@@ -286,10 +245,7 @@ class TestMessageQueueHandling:
         ]
 
         for msg in messages:
-            msg.update({"sender": "mqtt", "receiver": "bacnet_monitoring"})
-            await harness.send_message(msg)
-
-        await asyncio.sleep(0.5)
+            await harness.send_message({**msg, **MQTT_TO_BACNET_TPL})
 
         # Verify critical messages were processed first
         received = harness.get_actor_messages("bacnet_monitoring")
@@ -297,30 +253,23 @@ class TestMessageQueueHandling:
             # First processed should be critical or high priority
             assert received[0]["priority"] in ["critical", "high"]
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_message_queue_overflow_handling(self):
+    async def test_message_queue_overflow_handling(self, harness):
         """Test: Message queue handles overflow gracefully"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
         # Set queue limit
         harness.set_message_queue_limit("bacnet_monitoring", 10)
 
         # Send more messages than queue limit
-        overflow_detected = False
-        for i in range(15):
-            msg = {
-                "id": f"overflow_{i}",
-                "type": "BULK_MESSAGE",
-                "sender": "mqtt",
-                "receiver": "bacnet_monitoring",
-                "payload": {"index": i},
-            }
-            result = await harness.send_message(msg)
-            if result and result.get("status") == "queue_full":
-                overflow_detected = True
+        results = await asyncio.gather(
+            *(
+                harness.send_message(
+                    {**BULK_MESSAGE_TPL, "id": f"overflow_{i}", "payload": {"index": i}}
+                )
+                for i in range(15)
+            )
+        )
+        overflow_detected = any(
+            result and result.get("status") == "queue_full" for result in results
+        )
 
         # Should handle overflow (either drop or queue full response)
         assert (
@@ -328,134 +277,89 @@ class TestMessageQueueHandling:
             or len(harness.get_actor_messages("bacnet_monitoring")) <= 10
         )
 
-        await harness.cleanup()
-
 
+@freeze_time(FROZEN_TIME, real_asyncio=True)
 class TestInvalidMessageHandling:
     """Test invalid recipient and error handling"""
 
-    @pytest.mark.asyncio
-    async def test_invalid_recipient_handling(self):
-        """Test: Invalid recipient handling and error responses"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        harness.enable_message_logging()
-
-        # Send message to non-existent actor
-        test_message = {
-            "id": "invalid_recipient",
-            "type": "TEST_MESSAGE",
-            "sender": "mqtt",
-            "receiver": "non_existent_actor",
-            "payload": {},
-        }
-
-        result = await harness.send_message(test_message)
-
-        # Should return error or handle gracefully
-        assert result is None or result.get("error") == "recipient_not_found"
-
-        # Check for error message back to sender
-        error_messages = harness.get_actor_messages("mqtt")
-        error_msg = next(
-            (m for m in error_messages if m["type"] == "DELIVERY_ERROR"), None
-        )
-        if error_msg:
-            assert error_msg["payload"]["original_message_id"] == "invalid_recipient"
-
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_malformed_message_handling(self):
-        """Test: Malformed message handling"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        # Send malformed message (missing required fields)
-        malformed_message = {
-            "type": "MALFORMED",
-            # Missing 'sender' and 'receiver'
-            "payload": {},
-        }
-
-        result = await harness.send_message(malformed_message)
-
-        # Should reject malformed message
-        assert result is None or result.get("error") == "malformed_message"
-
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_message_validation_errors(self):
-        """Test: Message validation and error responses"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        # Send message with invalid payload
-        test_message = {
-            "id": "invalid_payload",
-            "type": "CONFIG_UPDATE",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
-            "payload": None,  # Invalid payload
-        }
-
+    @pytest.mark.parametrize(
+        "test_message,expected_error",
+        [
+            pytest.param(
+                {
+                    "id": "invalid_recipient",
+                    "type": "TEST_MESSAGE",
+                    "sender": "mqtt",
+                    "receiver": "non_existent_actor",
+                    "payload": {},
+                },
+                "recipient_not_found",
+                id="invalid_recipient",
+            ),
+            pytest.param(
+                # Missing 'sender' and 'receiver'
+                {"type": "MALFORMED", "payload": {}},
+                "malformed_message",
+                id="malformed",
+            ),
+            pytest.param(
+                {
+                    "id": "invalid_payload",
+                    **MQTT_TO_BACNET_TPL,
+                    "type": "CONFIG_UPDATE",
+                    "payload": None,
+                },
+                "invalid_payload",
+                id="invalid_payload",
+            ),
+            pytest.param(
+                {
+                    "id": "circular_test",
+                    **MQTT_TO_BACNET_TPL,
+                    "type": "FORWARD_MESSAGE",
+                    "forward_to": "mqtt",  # Would create circle
+                    "hop_count": 0,
+                    "max_hops": 3,
+                    "payload": {},
+                },
+                "max_hops_exceeded",
+                id="circular",
+            ),
+        ],
+    )
+    async def test_invalid_message(self, harness, test_message, expected_error):
+        """Test: Invalid messages are rejected or contained"""
         result = await harness.send_message(test_message)
 
-        # Should handle validation error
-        assert result is None or "error" in result
-
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_circular_message_prevention(self):
-        """Test: Prevent circular message routing"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        harness.enable_message_logging()
-
-        # Create a message that could cause circular routing
-        test_message = {
-            "id": "circular_test",
-            "type": "FORWARD_MESSAGE",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
-            "forward_to": "mqtt",  # Would create circle
-            "hop_count": 0,
-            "max_hops": 3,
-            "payload": {},
-        }
-
-        await harness.send_message(test_message)
-        await asyncio.sleep(0.5)
-
-        # Check that circular routing was prevented
-        all_messages = harness.messages
-        circular_messages = [m for m in all_messages if m.get("id") == "circular_test"]
+        if expected_error == "max_hops_exceeded":
+            # Circular routing must not exceed max_hops
+            circular_messages = [
+                m for m in harness.messages if m.get("id") == test_message["id"]
+            ]
+            assert len(circular_messages) <= test_message["max_hops"]
+            return
 
-        # Should not exceed max_hops
-        assert len(circular_messages) <= test_message["max_hops"]
+        # Should return error or handle gracefully
+        assert result is None or result.get("error") == expected_error
 
-        await harness.cleanup()
+        if expected_error == "recipient_not_found":
+            # Check for error message back to sender
+            error_msg = harness.error_for(test_message["id"])
+            assert error_msg is not None
+            assert error_msg["payload"]["original_message_id"] == test_message["id"]
 
 
+@freeze_time(FROZEN_TIME, real_asyncio=True)
 class TestMessageRoutingPatterns:
     """Test various message routing patterns"""
 
-    @pytest.mark.asyncio
-    async def test_request_response_pattern(self):
+    async def test_request_response_pattern(self, harness):
         """Test: Request-response message pattern"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
         # Send request and wait for response
         request = {
             "id": "req_123",
+            **MQTT_TO_BACNET_TPL,
             "type": "STATUS_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
             "response_required": True,
             "payload": {"query": "device_status"},
         }
@@ -467,14 +371,8 @@ class TestMessageRoutingPatterns:
         assert response["type"] == "STATUS_RESPONSE"
         assert "status" in response["payload"]
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_publish_subscribe_pattern(self):
+    async def test_publish_subscribe_pattern(self, harness):
         """Test: Publish-subscribe message pattern"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
         # Subscribe actors to a topic
         await harness.subscribe_actor("mqtt", "temperature_updates")
         await harness.subscribe_actor("uploader", "temperature_updates")
@@ -483,7 +381,7 @@ class TestMessageRoutingPatterns:
         publication = {
             "topic": "temperature_updates",
             "publisher": "bacnet_monitoring",
-            "payload": {"temperature": 25.5, "timestamp": time.time()},
+            "payload": {"temperature": 25.5, "timestamp": _FIXED_TS},
         }
 
         await harness.publish_to_topic(publication)
@@ -496,16 +394,8 @@ class TestMessageRoutingPatterns:
         assert any(m.get("topic") == "temperature_updates" for m in mqtt_messages)
         assert any(m.get("topic") == "temperature_updates" for m in uploader_messages)
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_message_chain_routing(self):
+    async def test_message_chain_routing(self, harness):
         """Test: Message chain routing through multiple actors"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
-        harness.enable_message_logging()
-
         # Create a message that routes through multiple actors
         chain_message = {
             "id": "chain_123",
@@ -520,19 +410,12 @@ class TestMessageRoutingPatterns:
 
         # Verify each actor in chain received the message
         for actor in ["mqtt", "bacnet_monitoring", "uploader"]:
-            messages = harness.get_actor_messages(actor)
-            assert any(
-                m.get("id") == "chain_123" for m in messages
+            assert harness.has_message_id(
+                actor, "chain_123"
             ), f"Actor {actor} did not receive chain message"
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_conditional_routing(self):
+    async def test_conditional_routing(self, harness):
         """Test: Conditional message routing based on content"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
         # Set up routing rules
         routing_rules = {
             "temperature": "bacnet_monitoring",
@@ -564,5 +447,3 @@ class TestMessageRoutingPatterns:
         assert any(
             m.get("type") == "upload" for m in uploader_msgs
         ), f"Messages: {uploader_msgs}"
-
-        await harness.cleanup()
@@ -6,33 +6,28 @@ correctly for device control and data collection.
 """
 
 import pytest
-import asyncio
 import time
-import sys
+from types import MappingProxyType
 
-# Add the fixtures directory to the path
-sys.path.insert(
-    0, "/Users/amol/Documents/ai-projects/bms-project/apps/bms-iot-app/tests"
+MQTT_TO_BACNET_TPL = MappingProxyType(
+    {"sender": "mqtt", "receiver": "bacnet_monitoring"}
+)
+BACNET_TO_MQTT_TPL = MappingProxyType(
+    {"sender": "bacnet_monitoring", "receiver": "mqtt"}
 )
 
-from fixtures.actor_test_harness import ActorTestHarness
+pytestmark = pytest.mark.xdist_group("mqtt_bacnet_communication")
 
 
 class TestMQTTToBACnetCommands:
     """Test MQTT to BACnet monitoring command flow"""
 
-    @pytest.mark.asyncio
-    async def test_start_monitoring_command(self):
+    async def test_start_monitoring_command(self, harness):
         """Test: MQTT actor sends START_MONITORING command to BACnet actor"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # MQTT receives external command to start monitoring
         start_command = {
             "type": "START_MONITORING_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
+            **MQTT_TO_BACNET_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "monitoring_config": {
@@ -48,7 +43,7 @@ class TestMQTTToBACnetCommands:
         assert result["status"] == "sent"
 
         # Wait for processing
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("bacnet_monitoring", "START_MONITORING_REQUEST")
 
         # Verify BACnet actor received the command
         bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
@@ -59,50 +54,31 @@ class TestMQTTToBACnetCommands:
         assert start_msg["payload"]["device_id"] == "BAC_DEVICE_001"
         assert len(start_msg["payload"]["monitoring_config"]["points"]) == 3
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_stop_monitoring_command(self):
+    async def test_stop_monitoring_command(self, harness):
         """Test: MQTT actor sends STOP_MONITORING command to BACnet actor"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # MQTT sends stop monitoring command
         stop_command = {
             "type": "STOP_MONITORING_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
+            **MQTT_TO_BACNET_TPL,
             "payload": {"device_id": "BAC_DEVICE_001", "reason": "user_requested"},
         }
 
         await harness.send_message(stop_command)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("bacnet_monitoring", "STOP_MONITORING_REQUEST")
 
         # Verify BACnet actor received stop command
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        stop_msg = next(
-            (m for m in bacnet_messages if m["type"] == "STOP_MONITORING_REQUEST"), None
-        )
+        stop_msg = harness.first_by_type("bacnet_monitoring", "STOP_MONITORING_REQUEST")
 
         assert stop_msg is not None
         assert stop_msg["payload"]["device_id"] == "BAC_DEVICE_001"
         assert stop_msg["payload"]["reason"] == "user_requested"
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_config_upload_command(self):
+    async def test_config_upload_command(self, harness):
         """Test: MQTT triggers config upload to BACnet device"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # MQTT sends config upload command
         config_command = {
             "type": "CONFIG_UPLOAD_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
+            **MQTT_TO_BACNET_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "config_data": {
@@ -126,33 +102,22 @@ class TestMQTTToBACnetCommands:
         }
 
         await harness.send_message(config_command)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("bacnet_monitoring", "CONFIG_UPLOAD_REQUEST")
 
         # Verify BACnet actor received config upload
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        config_msg = next(
-            (m for m in bacnet_messages if m["type"] == "CONFIG_UPLOAD_REQUEST"), None
-        )
+        config_msg = harness.first_by_type("bacnet_monitoring", "CONFIG_UPLOAD_REQUEST")
 
         assert config_msg is not None
         assert config_msg["payload"]["device_id"] == "BAC_DEVICE_001"
         assert "config_data" in config_msg["payload"]
         assert len(config_msg["payload"]["config_data"]["points_config"]) == 2
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_write_point_command(self):
+    async def test_write_point_command(self, harness):
         """Test: MQTT sends write point command to BACnet device"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # MQTT sends point write command
         write_command = {
             "type": "WRITE_POINT_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
+            **MQTT_TO_BACNET_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "point_name": "setpoint_temperature",
@@ -163,37 +128,27 @@ class TestMQTTToBACnetCommands:
         }
 
         await harness.send_message(write_command)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("bacnet_monitoring", "WRITE_POINT_REQUEST")
 
         # Verify BACnet actor received write command
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        write_msg = next(
-            (m for m in bacnet_messages if m["type"] == "WRITE_POINT_REQUEST"), None
-        )
+        write_msg = harness.first_by_type("bacnet_monitoring", "WRITE_POINT_REQUEST")
 
         assert write_msg is not None
         assert write_msg["payload"]["point_name"] == "setpoint_temperature"
         assert write_msg["payload"]["value"] == 22.5
         assert write_msg["payload"]["priority"] == 10
 
-        await harness.cleanup()
-
 
 class TestBACnetToMQTTData:
     """Test BACnet to MQTT data publishing flow"""
 
-    @pytest.mark.asyncio
-    async def test_point_data_publishing(self):
+    async def test_point_data_publishing(self, harness):
         """Test: BACnet actor publishes point data to MQTT"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
+        now = time.time()
         # BACnet actor sends point data to MQTT
         point_data = {
             "type": "POINT_DATA_UPDATE",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "points": [
@@ -201,27 +156,24 @@ class TestBACnetToMQTTData:
                         "name": "temperature",
                         "value": 23.5,
                         "quality": "good",
-                        "timestamp": time.time(),
+                        "timestamp": now,
                     },
                     {
                         "name": "humidity",
                         "value": 45.2,
                         "quality": "good",
-                        "timestamp": time.time(),
+                        "timestamp": now,
                     },
                 ],
-                "collection_timestamp": time.time(),
+                "collection_timestamp": now,
             },
         }
 
         await harness.send_message(point_data)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("mqtt", "POINT_DATA_UPDATE")
 
         # Verify MQTT actor received point data
-        mqtt_messages = harness.get_actor_messages("mqtt")
-        data_msg = next(
-            (m for m in mqtt_messages if m["type"] == "POINT_DATA_UPDATE"), None
-        )
+        data_msg = harness.first_by_type("mqtt", "POINT_DATA_UPDATE")
 
         assert data_msg is not None
         assert data_msg["payload"]["device_id"] == "BAC_DEVICE_001"
@@ -234,33 +186,26 @@ class TestBACnetToMQTTData:
         assert temp_point["value"] == 23.5
         assert temp_point["quality"] == "good"
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_bulk_data_publishing(self):
+    async def test_bulk_data_publishing(self, harness):
         """Test: BACnet actor publishes bulk data to MQTT"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
+        now = time.time()
         # Simulate bulk data collection
         bulk_data = {
             "type": "BULK_DATA_UPDATE",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "data_batch": [
                     {
-                        "timestamp": time.time() - 60,
+                        "timestamp": now - 60,
                         "points": {"temperature": 22.1, "humidity": 44.8},
                     },
                     {
-                        "timestamp": time.time() - 30,
+                        "timestamp": now - 30,
                         "points": {"temperature": 22.5, "humidity": 45.1},
                     },
                     {
-                        "timestamp": time.time(),
+                        "timestamp": now,
                         "points": {"temperature": 23.0, "humidity": 45.5},
                     },
                 ],
@@ -270,32 +215,21 @@ class TestBACnetToMQTTData:
         }
 
         await harness.send_message(bulk_data)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("mqtt", "BULK_DATA_UPDATE")
 
         # Verify MQTT received bulk data
-        mqtt_messages = harness.get_actor_messages("mqtt")
-        bulk_msg = next(
-            (m for m in mqtt_messages if m["type"] == "BULK_DATA_UPDATE"), None
-        )
+        bulk_msg = harness.first_by_type("mqtt", "BULK_DATA_UPDATE")
 
         assert bulk_msg is not None
         assert bulk_msg["payload"]["batch_size"] == 3
         assert len(bulk_msg["payload"]["data_batch"]) == 3
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_device_status_reporting(self):
+    async def test_device_status_reporting(self, harness):
         """Test: BACnet actor reports device status to MQTT"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # BACnet reports device status changes
         status_report = {
             "type": "DEVICE_STATUS_UPDATE",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "status": "online",
@@ -310,33 +244,22 @@ class TestBACnetToMQTTData:
         }
 
         await harness.send_message(status_report)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("mqtt", "DEVICE_STATUS_UPDATE")
 
         # Verify MQTT received status update
-        mqtt_messages = harness.get_actor_messages("mqtt")
-        status_msg = next(
-            (m for m in mqtt_messages if m["type"] == "DEVICE_STATUS_UPDATE"), None
-        )
+        status_msg = harness.first_by_type("mqtt", "DEVICE_STATUS_UPDATE")
 
         assert status_msg is not None
         assert status_msg["payload"]["status"] == "online"
         assert status_msg["payload"]["connection_quality"] == "excellent"
         assert status_msg["payload"]["error_count"] == 0
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_alarm_notification(self):
+    async def test_alarm_notification(self, harness):
         """Test: BACnet actor sends alarm notifications to MQTT"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # BACnet detects and reports alarm condition
         alarm_notification = {
             "type": "ALARM_NOTIFICATION",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "alarm_type": "HIGH_TEMPERATURE",
@@ -350,38 +273,27 @@ class TestBACnetToMQTTData:
         }
 
         await harness.send_message(alarm_notification)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("mqtt", "ALARM_NOTIFICATION")
 
         # Verify MQTT received alarm
-        mqtt_messages = harness.get_actor_messages("mqtt")
-        alarm_msg = next(
-            (m for m in mqtt_messages if m["type"] == "ALARM_NOTIFICATION"), None
-        )
+        alarm_msg = harness.first_by_type("mqtt", "ALARM_NOTIFICATION")
 
         assert alarm_msg is not None
         assert alarm_msg["payload"]["alarm_type"] == "HIGH_TEMPERATURE"
         assert alarm_msg["payload"]["severity"] == "high"
         assert alarm_msg["payload"]["current_value"] == 35.2
 
-        await harness.cleanup()
-
 
 class TestBidirectionalCommandResponse:
     """Test bidirectional command-response patterns"""
 
-    @pytest.mark.asyncio
-    async def test_command_acknowledgment_flow(self):
+    async def test_command_acknowledgment_flow(self, harness):
         """Test: Complete command-acknowledgment cycle between MQTT and BACnet"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Step 1: MQTT sends command
         command = {
             "id": "cmd_12345",
             "type": "START_MONITORING_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
+            **MQTT_TO_BACNET_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "monitoring_config": {"interval": 60},
@@ -389,14 +301,13 @@ class TestBidirectionalCommandResponse:
         }
 
         await harness.send_message(command)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("bacnet_monitoring", "START_MONITORING_REQUEST")
 
         # Step 2: BACnet sends acknowledgment back
         acknowledgment = {
             "id": "ack_12345",
             "type": "COMMAND_ACKNOWLEDGMENT",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "original_command_id": "cmd_12345",
                 "status": "accepted",
@@ -406,39 +317,24 @@ class TestBidirectionalCommandResponse:
         }
 
         await harness.send_message(acknowledgment)
-        await asyncio.sleep(0.1)
-
-        # Verify both messages were processed
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
-        mqtt_messages = harness.get_actor_messages("mqtt")
+        await harness.wait_for_message("mqtt", "COMMAND_ACKNOWLEDGMENT")
 
         # Check command was received
-        cmd_msg = next((m for m in bacnet_messages if m.get("id") == "cmd_12345"), None)
-        assert cmd_msg is not None
+        assert harness.has_message_id("bacnet_monitoring", "cmd_12345")
 
         # Check acknowledgment was received
-        ack_msg = next(
-            (m for m in mqtt_messages if m["type"] == "COMMAND_ACKNOWLEDGMENT"), None
-        )
+        ack_msg = harness.first_by_type("mqtt", "COMMAND_ACKNOWLEDGMENT")
         assert ack_msg is not None
         assert ack_msg["payload"]["original_command_id"] == "cmd_12345"
         assert ack_msg["payload"]["status"] == "accepted"
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_error_response_flow(self):
+    async def test_error_response_flow(self, harness):
         """Test: Error response flow when BACnet command fails"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # MQTT sends problematic command
         problematic_command = {
             "id": "cmd_error",
             "type": "WRITE_POINT_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
+            **MQTT_TO_BACNET_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_OFFLINE",
                 "point_name": "invalid_point",
@@ -447,13 +343,12 @@ class TestBidirectionalCommandResponse:
         }
 
         await harness.send_message(problematic_command)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("bacnet_monitoring", "WRITE_POINT_REQUEST")
 
         # BACnet responds with error
         error_response = {
             "type": "COMMAND_ERROR",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "original_command_id": "cmd_error",
                 "error_type": "DEVICE_UNREACHABLE",
@@ -464,32 +359,22 @@ class TestBidirectionalCommandResponse:
         }
 
         await harness.send_message(error_response)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("mqtt", "COMMAND_ERROR")
 
         # Verify error response was received by MQTT
-        mqtt_messages = harness.get_actor_messages("mqtt")
-        error_msg = next(
-            (m for m in mqtt_messages if m["type"] == "COMMAND_ERROR"), None
-        )
+        error_msg = harness.first_by_type("mqtt", "COMMAND_ERROR")
 
         assert error_msg is not None
         assert error_msg["payload"]["error_type"] == "DEVICE_UNREACHABLE"
         assert error_msg["payload"]["retry_recommended"] is True
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_request_response_timeout(self):
+    async def test_request_response_timeout(self, harness):
         """Test: Request-response timeout handling"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
         # Send request with timeout
         request = {
             "id": "req_timeout",
             "type": "STATUS_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
+            **MQTT_TO_BACNET_TPL,
             "timeout": 0.5,
             "payload": {"device_id": "BAC_DEVICE_001"},
         }
@@ -501,18 +386,12 @@ class TestBidirectionalCommandResponse:
         assert response is not None
         assert response["request_id"] == "req_timeout"
 
-        await harness.cleanup()
-
 
 class TestCommunicationResilience:
     """Test communication resilience and error handling"""
 
-    @pytest.mark.asyncio
-    async def test_message_retry_on_failure(self):
+    async def test_message_retry_on_failure(self, harness):
         """Test: Message retry when communication fails"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-
         # Configure retry policy
         retry_config = {"max_retries": 3, "retry_delay": 0.1}
 
@@ -520,8 +399,7 @@ class TestCommunicationResilience:
         critical_command = {
             "id": "critical_cmd",
             "type": "EMERGENCY_STOP",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
+            **MQTT_TO_BACNET_TPL,
             "payload": {"device_id": "BAC_DEVICE_001", "emergency_type": "FIRE_ALARM"},
         }
 
@@ -531,36 +409,28 @@ class TestCommunicationResilience:
         assert result["delivered"] is True
         assert result["attempts"] <= retry_config["max_retries"]
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_connection_recovery_flow(self):
+    async def test_connection_recovery_flow(self, harness):
         """Test: Connection recovery communication flow"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
+        now = time.time()
         # Step 1: BACnet reports connection lost
         connection_lost = {
             "type": "CONNECTION_STATUS_UPDATE",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "connection_status": "disconnected",
                 "error_reason": "network_timeout",
-                "timestamp": time.time(),
+                "timestamp": now,
             },
         }
 
         await harness.send_message(connection_lost)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("mqtt", "CONNECTION_STATUS_UPDATE")
 
         # Step 2: MQTT sends reconnection command
         reconnect_command = {
             "type": "RECONNECT_REQUEST",
-            "sender": "mqtt",
-            "receiver": "bacnet_monitoring",
+            **MQTT_TO_BACNET_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "retry_count": 1,
@@ -569,130 +439,90 @@ class TestCommunicationResilience:
         }
 
         await harness.send_message(reconnect_command)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("bacnet_monitoring", "RECONNECT_REQUEST")
 
         # Step 3: BACnet reports successful reconnection
         reconnected = {
             "type": "CONNECTION_STATUS_UPDATE",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "connection_status": "connected",
-                "reconnection_timestamp": time.time(),
+                "reconnection_timestamp": now,
                 "connection_quality": "good",
             },
         }
 
         await harness.send_message(reconnected)
-        await asyncio.sleep(0.1)
+        await harness.wait_for_message("mqtt", "CONNECTION_STATUS_UPDATE")
 
         # Verify complete recovery flow
-        mqtt_messages = harness.get_actor_messages("mqtt")
-        bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
+        statuses = [
+            m["payload"]["connection_status"]
+            for m in harness.actor_by_type("mqtt", "CONNECTION_STATUS_UPDATE")
+        ]
 
         # Check disconnect notification
-        disconnect_msg = next(
-            (
-                m
-                for m in mqtt_messages
-                if m["type"] == "CONNECTION_STATUS_UPDATE"
-                and m["payload"]["connection_status"] == "disconnected"
-            ),
-            None,
-        )
-        assert disconnect_msg is not None
+        assert "disconnected" in statuses
 
         # Check reconnect command
-        reconnect_msg = next(
-            (m for m in bacnet_messages if m["type"] == "RECONNECT_REQUEST"), None
-        )
+        reconnect_msg = harness.first_by_type("bacnet_monitoring", "RECONNECT_REQUEST")
         assert reconnect_msg is not None
 
         # Check successful reconnection
-        connect_msg = next(
-            (
-                m
-                for m in mqtt_messages
-                if m["type"] == "CONNECTION_STATUS_UPDATE"
-                and m["payload"]["connection_status"] == "connected"
-            ),
-            None,
-        )
-        assert connect_msg is not None
-
-        await harness.cleanup()
+        assert "connected" in statuses
 
-    @pytest.mark.asyncio
-    async def test_message_priority_handling(self):
+    async def test_message_priority_handling(self, harness):
         """Test: High priority messages are handled first"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Send messages with different priorities
         messages = [
             {
                 "id": "low_priority",
                 "type": "ROUTINE_DATA_COLLECTION",
                 "priority": "low",
-                "sender": "mqtt",
-                "receiver": "bacnet_monitoring",
+                **MQTT_TO_BACNET_TPL,
                 "payload": {},
             },
             {
                 "id": "high_priority",
                 "type": "EMERGENCY_STOP",
                 "priority": "critical",
-                "sender": "mqtt",
-                "receiver": "bacnet_monitoring",
+                **MQTT_TO_BACNET_TPL,
                 "payload": {},
             },
             {
                 "id": "normal_priority",
                 "type": "STATUS_REQUEST",
                 "priority": "normal",
-                "sender": "mqtt",
-                "receiver": "bacnet_monitoring",
+                **MQTT_TO_BACNET_TPL,
                 "payload": {},
             },
         ]
 
         # Send all messages
-        for msg in messages:
-            await harness.send_message(msg)
-
-        await asyncio.sleep(0.2)
+        await harness.send_batch(messages)
+        await harness.wait_for_message("bacnet_monitoring", "STATUS_REQUEST")
 
         # Verify messages were processed
         bacnet_messages = harness.get_actor_messages("bacnet_monitoring")
         assert len(bacnet_messages) == 3
 
         # Check that critical message exists
-        critical_msg = next(
-            (m for m in bacnet_messages if m.get("priority") == "critical"), None
-        )
+        critical_msg = harness.get_by_id("bacnet_monitoring", "high_priority")
         assert critical_msg is not None
+        assert critical_msg["priority"] == "critical"
         assert critical_msg["type"] == "EMERGENCY_STOP"
 
-        await harness.cleanup()
-
 
 class TestDataValidationAndSerialization:
     """Test data validation and serialization between MQTT and BACnet"""
 
-    @pytest.mark.asyncio
-    async def test_point_data_validation(self):
+    async def test_point_data_validation(self, harness):
         """Test: Point data validation in MQTT-BACnet communication"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Valid point data
         valid_data = {
             "type": "POINT_DATA_UPDATE",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "points": [
@@ -712,8 +542,7 @@ class TestDataValidationAndSerialization:
         # Invalid data (missing required fields)
         invalid_data = {
             "type": "POINT_DATA_UPDATE",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
+            **BACNET_TO_MQTT_TPL,
             "payload": {
                 "device_id": "BAC_DEVICE_001",
                 "points": [
@@ -729,44 +558,20 @@ class TestDataValidationAndSerialization:
         result = await harness.send_message(invalid_data)
         assert result is not None
 
-        await harness.cleanup()
-
-    @pytest.mark.asyncio
-    async def test_large_data_handling(self):
+    async def test_large_data_handling(self, harness, large_bulk_points):
         """Test: Handling large data payloads"""
-        harness = ActorTestHarness()
-        await harness.initialize()
-        harness.enable_message_logging()
-
         # Create large payload with many points
         large_payload = {
             "type": "BULK_DATA_UPDATE",
-            "sender": "bacnet_monitoring",
-            "receiver": "mqtt",
-            "payload": {"device_id": "BAC_DEVICE_001", "points": []},
+            **BACNET_TO_MQTT_TPL,
+            "payload": {"device_id": "BAC_DEVICE_001", "points": large_bulk_points},
         }
 
-        # Generate 100 data points
-        current_time = time.time()
-        for i in range(100):
-            point = {
-                "name": f"point_{i}",
-                "value": 20.0 + i * 0.1,
-                "quality": "good",
-                "timestamp": current_time + i,
-            }
-            large_payload["payload"]["points"].append(point)
-
         result = await harness.send_message(large_payload)
         assert result["status"] == "sent"
 
         # Verify message was received
-        mqtt_messages = harness.get_actor_messages("mqtt")
-        large_msg = next(
-            (m for m in mqtt_messages if m["type"] == "BULK_DATA_UPDATE"), None
-        )
+        large_msg = harness.first_by_type("mqtt", "BULK_DATA_UPDATE")
 
         assert large_msg is not None
         assert len(large_msg["payload"]["points"]) == 100
-
-        await harness.cleanup()
@@ -7,6 +7,7 @@ property reading through SQLite storage to MQTT publishing.
 
 import json
 from unittest.mock import Mock
+from fixtures.bacnet import EventTransitionBits, LimitEnable, PriorityArray
 from src.models.controller_points import ControllerPointsModel
 from src.network.mqtt_command_dispatcher import _serialize_point
 from src.utils.bacnet_health_processor import BACnetHealthProcessor
@@ -33,43 +34,17 @@ class TestOptionalPropertiesEndToEnd:
             "highLimit": 85.0,
             "lowLimit": 15.0,
             "resolution": 0.1,
-            "priorityArray": Mock(__class__=Mock(__name__="PriorityArray")),
+            "priorityArray": PriorityArray({7: 25.0, 15: 18.5}),
             "relinquishDefault": 20.0,
             "covIncrement": 0.5,
             "timeDelay": 300,
-            "limitEnable": Mock(__class__=Mock(__name__="LimitEnable")),
-            "eventEnable": Mock(__class__=Mock(__name__="EventTransitionBits")),
+            "limitEnable": LimitEnable([1, 1]),
+            "eventEnable": EventTransitionBits([1, 1, 0]),
             "eventDetectionEnable": True,
         }
 
-        # Mock priority array access with self parameter
-        def mock_priority_getitem(self, index):
-            if index == 7:
-                return 25.0
-            elif index == 15:
-                return 18.5
-            return None
-
-        raw_properties["priorityArray"].__getitem__ = mock_priority_getitem
-
-        # Mock limit enable
-        raw_properties["limitEnable"].value = [1, 1]
-
-        # Mock event enable
-        raw_properties["eventEnable"].value = [1, 1, 0]
-
-        # Process health properties
-        health_data = BACnetHealthProcessor.process_all_health_properties(
-            raw_properties
-        )
-
-        # Process optional properties
-        optional_data = BACnetHealthProcessor.process_all_optional_properties(
-            raw_properties
-        )
-
-        # Merge data (as done in monitor.py)
-        combined_data = {**health_data, **optional_data}
+        # Process health and optional properties
+        combined_data = BACnetHealthProcessor.process_all(raw_properties)
 
         # Create ControllerPointsModel with processed data
         point = ControllerPointsModel(
@@ -227,13 +202,7 @@ class TestOptionalPropertiesEndToEnd:
         }
 
         # Step 2: Process properties (as done in monitor.py)
-        health_data = BACnetHealthProcessor.process_all_health_properties(
-            raw_bacnet_data
-        )
-        optional_data = BACnetHealthProcessor.process_all_optional_properties(
-            raw_bacnet_data
-        )
-        combined_data = {**health_data, **optional_data}
+        combined_data = BACnetHealthProcessor.process_all(raw_bacnet_data)
 
         # Step 3: Store in SQLite (ControllerPointsModel)
         point = ControllerPointsModel(
@@ -302,13 +271,7 @@ class TestOptionalPropertiesEndToEnd:
         }
 
         # Process as usual
-        health_data = BACnetHealthProcessor.process_all_health_properties(
-            legacy_bacnet_data
-        )
-        optional_data = BACnetHealthProcessor.process_all_optional_properties(
-            legacy_bacnet_data
-        )
-        combined_data = {**health_data, **optional_data}
+        combined_data = BACnetHealthProcessor.process_all(legacy_bacnet_data)
 
         # Create point (optional properties should be None)
         point = ControllerPointsModel(
@@ -352,27 +315,12 @@ class TestOptionalPropertiesEndToEnd:
         """Test: Complex BACnet properties maintain integrity through full pipeline."""
 
         # Create complex BACnet properties
-        mock_priority_array = Mock(__class__=Mock(__name__="PriorityArray"))
-
-        def priority_getitem(self, index):
-            # Realistic priority array with manual override and relinquish default
-            if index == 7:
-                return 25.5  # Manual override at priority 8
-            elif index == 15:
-                return 18.0  # Relinquish default at priority 16
-            return None
-
-        mock_priority_array.__getitem__ = priority_getitem
-
-        mock_limit_enable = Mock(__class__=Mock(__name__="LimitEnable"))
-        mock_limit_enable.value = [1, 0]  # Low limit enabled, high limit disabled
-
-        mock_event_enable = Mock(__class__=Mock(__name__="EventTransitionBits"))
-        mock_event_enable.value = [
-            1,
-            1,
-            0,
-        ]  # Fault and normal enabled, offnormal disabled
+        # Manual override at priority 8, relinquish default at priority 16
+        priority_array = PriorityArray({7: 25.5, 15: 18.0})
+        # Low limit enabled, high limit disabled
+        limit_enable = LimitEnable([1, 0])
+        # Fault and normal enabled, offnormal disabled
+        event_enable = EventTransitionBits([1, 1, 0])
 
         # Simulate complex BACnet reading
         complex_bacnet_data = {
@@ -382,10 +330,10 @@ class TestOptionalPropertiesEndToEnd:
             "eventState": "normal",
             "outOfService": False,
             "reliability": "noFaultDetected",
-            "priorityArray": mock_priority_array,
+            "priorityArray": priority_array,
             "relinquishDefault": 18.0,
-            "limitEnable": mock_limit_enable,
-            "eventEnable": mock_event_enable,
+            "limitEnable": limit_enable,
+            "eventEnable": event_enable,
             "eventTimeStamps": [
                 Mock(isoformat=lambda: "2024-01-01T10:30:00Z"),
                 None,
@@ -399,13 +347,7 @@ class TestOptionalPropertiesEndToEnd:
         }
 
         # Process through pipeline
-        health_data = BACnetHealthProcessor.process_all_health_properties(
-            complex_bacnet_data
-        )
-        optional_data = BACnetHealthProcessor.process_all_optional_properties(
-            complex_bacnet_data
-        )
-        combined_data = {**health_data, **optional_data}
+        combined_data = BACnetHealthProcessor.process_all(complex_bacnet_data)
 
         # Store and serialize
         point = ControllerPointsModel(
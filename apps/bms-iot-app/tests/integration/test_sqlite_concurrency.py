@@ -5,7 +5,6 @@ Run this single file to test all database locking improvements.
 
 import asyncio
 import pytest
-import pytest_asyncio
 import time
 from concurrent.futures import ThreadPoolExecutor
 from src.models.iot_device_status import (
@@ -17,32 +16,9 @@ from src.models.device_status_enums import MonitoringStatusEnum
 from src.network.sqlmodel_client import (
     get_session,
     verify_database_connectivity,
-    initialize_database,
 )
 
 
-# Global setup for tests
-@pytest_asyncio.fixture(scope="session", autouse=True)
-async def setup_database():
-    """Initialize database tables before running tests"""
-    try:
-        # Import all models to ensure they're registered with SQLModel
-        from sqlmodel import SQLModel
-        from src.network.sqlmodel_client import get_engine
-
-        # Create all tables using SQLModel metadata
-        engine = get_engine()
-        async with engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
-
-        # Initialize database optimizations
-        await initialize_database()
-        print("Test database initialized successfully")
-    except Exception as e:
-        print(f"Test database initialization failed: {e}")
-        raise
-
-
 # Add fixture to reset logger state between tests
 @pytest.fixture(autouse=True)
 def reset_logger_state():
@@ -69,9 +45,17 @@ class TestSQLiteConcurrency:
         await verify_database_connectivity()
 
     @pytest.mark.asyncio
-    async def test_concurrent_status_updates(self):
+    @pytest.mark.parametrize(
+        "distinct_devices", [False, True], ids=["shared-device", "distinct-devices"]
+    )
+    async def test_concurrent_status_updates(self, caplog, distinct_devices):
         """Test multiple concurrent database writes (unit test)"""
-        device_id = f"test-device-{int(time.time())}"
+        # Production has one status row per device; the shared case keeps the
+        # worst-case contention on a single row
+        device_ids = [
+            f"test-device-distinct-{i}" if distinct_devices else "test-device-shared"
+            for i in range(50)
+        ]
 
         async def write_status(iteration: int):
             try:
@@ -82,7 +66,9 @@ class TestSQLiteConcurrency:
                     "cpu_usage_percent": float(iteration % 100),
                     "memory_usage_percent": float((iteration * 2) % 100),
                 }
-                return await upsert_iot_device_status(device_id, status_data)
+                return await upsert_iot_device_status(
+                    device_ids[iteration], status_data
+                )
             except RuntimeError as e:
                 # Ignore logger queue issues in test environment
                 if "Queue" in str(e) and "maxsize" in str(e):
@@ -112,10 +98,15 @@ class TestSQLiteConcurrency:
         ), f"Found {len(real_exceptions)} real exceptions: {real_exceptions[:3]}"
         assert len(successful_writes) > 0, "Should have at least some successful writes"
 
+        # Write sessions wait for the lock instead of failing with "database is locked"
+        retries = [r for r in caplog.records if "retrying in" in r.getMessage()]
+        assert retries == [], f"Unexpected DB retries: {retries[:3]}"
+
         # Verify final state
-        final_status = await get_latest_iot_device_status(device_id)
-        assert final_status is not None
-        assert final_status.iot_device_id == device_id
+        for device_id in set(device_ids):
+            final_status = await get_latest_iot_device_status(device_id)
+            assert final_status is not None
+            assert final_status.iot_device_id == device_id
 
         print(f"50 concurrent writes completed in {duration:.2f}s")
 
@@ -143,7 +134,7 @@ class TestSQLiteConcurrency:
     @pytest.mark.asyncio
     async def test_high_frequency_operations(self):
         """Test high-frequency database operations (stress test)"""
-        device_id = f"stress-test-{int(time.time())}"
+        device_id = "stress-test-device"
         operation_count = 50  # Reduced from 100 to be more reasonable
 
         async def rapid_update(i: int):
@@ -223,33 +214,33 @@ class TestSQLiteConcurrency:
         assert result is not None
         print("Session operation completed successfully with context manager pattern")
 
-    def test_concurrent_threads(self):
+    @pytest.mark.asyncio
+    async def test_concurrent_threads(self):
         """Test database access from multiple threads (integration test)"""
+        loop = asyncio.get_running_loop()
 
-        def thread_worker(thread_id: int):
-            import asyncio
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            async def worker():
-                device_id = f"thread-{thread_id}-{int(time.time())}"
-                for i in range(10):
-                    status_data = {
-                        "organization_id": f"org-{thread_id}",
-                        "site_id": f"site-{thread_id}",
-                        "cpu_usage_percent": float(i * 10),
-                        "monitoring_status": MonitoringStatusEnum.ACTIVE,
-                    }
-                    await upsert_iot_device_status(device_id, status_data)
-                return thread_id
+        async def worker(thread_id: int):
+            device_id = f"thread-device-{thread_id}"
+            for i in range(10):
+                status_data = {
+                    "organization_id": f"org-{thread_id}",
+                    "site_id": f"site-{thread_id}",
+                    "cpu_usage_percent": float(i * 10),
+                    "monitoring_status": MonitoringStatusEnum.ACTIVE,
+                }
+                await upsert_iot_device_status(device_id, status_data)
+            return thread_id
 
-            return loop.run_until_complete(worker())
+        def thread_worker(thread_id: int):
+            # Submit to the shared loop rather than a per-thread loop so every
+            # thread goes through the same engine and connection pool
+            return asyncio.run_coroutine_threadsafe(worker(thread_id), loop).result()
 
         # Test with 5 concurrent threads
         with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(thread_worker, i) for i in range(5)]
-            results = [f.result() for f in futures]
+            results = await asyncio.gather(
+                *(loop.run_in_executor(executor, thread_worker, i) for i in range(5))
+            )
 
         assert len(results) == 5
         print(f"Thread test completed: {results}")
@@ -12,41 +12,58 @@ violations including:
 
 import pytest
 import asyncio
+import logging
+import time
 from src.models.controller_points import (
     ControllerPointsModel,
     bulk_insert_controller_points,
 )
 from src.models.bacnet_types import BacnetObjectTypeEnum
+from src.network.sqlmodel_client import _is_retryable_error
 
+logger = logging.getLogger(__name__)
 
-class TestSQLiteSessionConcurrencyFixes:
-    """Test SQLite session concurrency fixes: defensive ID validation + fetch instead of refresh"""
+# InvalidRequestError patterns
+SESSION_ERRORS = (
+    Exception("InvalidRequestError: Could not refresh instance"),
+    Exception("Instance is not persistent within this Session"),
+    Exception("object is not bound to a session"),
+    Exception("object is already attached to session"),
+)
+RETRYABLE_ERRORS = (
+    Exception("database is locked"),
+    Exception("database table is locked"),
+    Exception("connection was invalidated"),
+)
+
+# Seconds allowed for each load case. A warmup run of (64, 20) takes about 2s;
+# a writer stalled on the 30s busy_timeout or the pool timeout blows the budget.
+WRITE_LOCK_LOAD_BUDGET_SECONDS = 15.0
 
-    @pytest.mark.asyncio
-    async def test_setup_database(self):
-        """Create the database table for testing"""
-        from sqlmodel import SQLModel
-        from src.network.sqlmodel_client import get_engine
 
-        # Import all models to register them with SQLModel
+@pytest.fixture
+def client_caplog(caplog):
+    """caplog that also captures the DB client logger
 
-        # Create all tables using SQLModel metadata
-        engine = get_engine()
-        async with engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
-        print("✅ Database tables created")
+    The logging setup stops the "src" logger from propagating, so records from
+    src.network.sqlmodel_client never reach caplog's root handler on their own.
+    """
+    client_logger = logging.getLogger("src.network.sqlmodel_client")
+    client_logger.addHandler(caplog.handler)
+    yield caplog
+    client_logger.removeHandler(caplog.handler)
+
+
+class TestSQLiteSessionConcurrencyFixes:
+    """Test SQLite session concurrency fixes: defensive ID validation + fetch instead of refresh"""
 
     @pytest.mark.asyncio
     async def test_bulk_insert_with_session_fixes(self):
         """Test that the new implementation eliminates refresh errors"""
 
-        # Ensure table exists
-        await self.test_setup_database()
-
         # Create 11 points (same as production error) including some with id=0
-        points = []
-        for i in range(11):
-            point = ControllerPointsModel(
+        points = [
+            ControllerPointsModel(
                 controller_ip_address="192.168.1.100",
                 bacnet_object_type=BacnetObjectTypeEnum.ANALOG_INPUT,
                 point_id=5000 + i,
@@ -55,114 +72,122 @@ class TestSQLiteSessionConcurrencyFixes:
                 controller_device_id="phase5_device",
                 present_value=f"{100.0 + i}",
             )
+            for i in range(11)
+        ]
 
-            # Simulate problematic id=0 for some points (defensive test)
-            if i % 3 == 0:  # Every 3rd point gets id=0
-                point.id = 0
-                print(f"🔍 Set point {i} to have id=0 (will test defensive fix)")
-
-            points.append(point)
+        # Simulate problematic id=0 for every 3rd point (defensive test)
+        for i in range(0, len(points), 3):
+            points[i].id = 0
+            logger.debug("Set point %d to have id=0 (will test defensive fix)", i)
 
-        print(f"🔍 Created {len(points)} points, some with id=0 for defensive testing")
+        logger.debug(
+            "Created %d points, some with id=0 for defensive testing", len(points)
+        )
 
         # This should work with session concurrency fixes
         try:
             await bulk_insert_controller_points(points)
-            print(
-                f"✅ Session concurrency fixes succeeded! Processed {len(points)} points"
-            )
+            logger.debug("Session concurrency fixes processed %d points", len(points))
 
             # Verify all points have valid database IDs (assigned in-place)
             for i, point in enumerate(points):
                 assert point.id is not None
                 assert point.id > 0
-                print(f"📋 Point {i}: id={point.id}, point_id={point.point_id}")
+                logger.debug(
+                    "Point %d: id=%s, point_id=%s", i, point.id, point.point_id
+                )
 
-            print("🎉 Session concurrency fixes successfully handled all edge cases!")
             return points
 
         except Exception as e:
-            print(f"❌ Session concurrency fixes failed: {e}")
+            logger.debug("Session concurrency fixes failed: %s", e)
             raise
 
     @pytest.mark.asyncio
     async def test_concurrent_bulk_operations(self):
-        """Test concurrent bulk operations don't cause session issues"""
-
-        # Ensure table exists
-        await self.test_setup_database()
-
-        async def concurrent_bulk_insert(batch_id: int):
-            """Simulate concurrent bulk insert operations"""
-            points = []
-            for i in range(5):
-                point = ControllerPointsModel(
-                    controller_ip_address="192.168.1.100",
-                    bacnet_object_type=BacnetObjectTypeEnum.BINARY_INPUT,
-                    point_id=6000 + (batch_id * 100) + i,
-                    iot_device_point_id=f"concurrent_point_{batch_id}_{i}",
-                    controller_id=f"concurrent_controller_{batch_id}",
-                    controller_device_id=f"concurrent_device_{batch_id}",
-                    present_value=f"{batch_id}.{i}",
-                )
-                points.append(point)
+        """Test bulk inserts spanning several controllers don't cause session issues"""
 
-            await bulk_insert_controller_points(points)
-            return points
-
-        # Run multiple concurrent bulk inserts
-        print("🔍 Starting concurrent bulk insert operations...")
-        tasks = [concurrent_bulk_insert(i) for i in range(5)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Analyze results
-        successes = [r for r in results if isinstance(r, list)]
-        exceptions = [r for r in results if isinstance(r, Exception)]
-
-        print(
-            f"📊 Concurrent Results: {len(successes)} successes, {len(exceptions)} exceptions"
-        )
+        # SQLite serializes writers, so one bulk insert covers the same rows as
+        # concurrent per-controller inserts without contending for the pool
+        all_points = [
+            ControllerPointsModel(
+                controller_ip_address="192.168.1.100",
+                bacnet_object_type=BacnetObjectTypeEnum.BINARY_INPUT,
+                point_id=6000 + (batch_id * 100) + i,
+                iot_device_point_id=f"concurrent_point_{batch_id}_{i}",
+                controller_id=f"concurrent_controller_{batch_id}",
+                controller_device_id=f"concurrent_device_{batch_id}",
+                present_value=f"{batch_id}.{i}",
+            )
+            for batch_id in range(5)
+            for i in range(5)
+        ]
 
-        if exceptions:
-            print("❌ Found exceptions in concurrent operations:")
-            for exc in exceptions:
-                print(f"   {type(exc).__name__}: {exc}")
-            raise AssertionError(f"Concurrent operations failed: {exceptions}")
+        logger.debug("Starting bulk insert for 5 controllers")
+        await bulk_insert_controller_points(all_points)
 
-        # Verify all operations succeeded
-        assert (
-            len(successes) == 5
-        ), f"Expected 5 successful operations, got {len(successes)}"
+        batches = [all_points[i : i + 5] for i in range(0, len(all_points), 5)]
+        assert len(batches) == 5, f"Expected 5 batches, got {len(batches)}"
 
-        total_points = sum(len(batch) for batch in successes)
-        print(
-            f"✅ Concurrent operations successful! Total points processed: {total_points}"
-        )
+        total_points = sum(len(batch) for batch in batches)
+        logger.debug("Bulk insert processed %d points", total_points)
 
         # Verify all points have unique IDs
-        all_ids = []
-        for batch in successes:
-            for point in batch:
-                all_ids.append(point.id)
+        all_ids = [point.id for batch in batches for point in batch]
 
         unique_ids = set(all_ids)
         assert len(unique_ids) == len(
             all_ids
         ), f"Found duplicate IDs: {len(unique_ids)} unique vs {len(all_ids)} total"
 
-        print("🎉 All concurrent operations completed without session errors!")
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("n_tasks,n_rows", [(16, 10), (64, 20)])
+    async def test_write_lock_under_load(self, client_caplog, n_tasks, n_rows):
+        """Test many concurrent bulk inserts queue on the write lock without retries"""
+
+        async def concurrent_bulk_insert(batch_id: int):
+            points = [
+                ControllerPointsModel(
+                    controller_ip_address="192.168.1.101",
+                    bacnet_object_type=BacnetObjectTypeEnum.ANALOG_VALUE,
+                    point_id=i,
+                    iot_device_point_id=f"load_point_{n_tasks}_{batch_id}_{i}",
+                    controller_id=f"load_controller_{n_tasks}_{batch_id}",
+                    controller_device_id=f"load_device_{n_tasks}_{batch_id}",
+                    present_value=f"{batch_id}.{i}",
+                )
+                for i in range(n_rows)
+            ]
+            await bulk_insert_controller_points(points)
+            return points
+
+        start_time = time.perf_counter()
+        results = await asyncio.gather(
+            *[concurrent_bulk_insert(i) for i in range(n_tasks)]
+        )
+        elapsed = time.perf_counter() - start_time
+        logger.debug("%d tasks x %d rows inserted in %.2fs", n_tasks, n_rows, elapsed)
+
+        all_ids = [point.id for batch in results for point in batch]
+        assert len(all_ids) == n_tasks * n_rows
+        assert all(point_id is not None and point_id > 0 for point_id in all_ids)
+        assert len(set(all_ids)) == len(all_ids), "Found duplicate IDs"
+
+        retries = [
+            r for r in client_caplog.records if "retrying in" in r.getMessage()
+        ]
+        assert retries == [], f"Unexpected DB retries: {retries[:3]}"
+        assert (
+            elapsed < WRITE_LOCK_LOAD_BUDGET_SECONDS
+        ), f"Bulk inserts took {elapsed:.2f}s (budget {WRITE_LOCK_LOAD_BUDGET_SECONDS}s)"
 
     @pytest.mark.asyncio
     async def test_id_zero_defensive_handling(self):
         """Test that id=0 is properly handled defensively"""
 
-        # Ensure table exists
-        await self.test_setup_database()
-
         # Create points with explicit id=0 (edge case)
-        points = []
-        for i in range(3):
-            point = ControllerPointsModel(
+        points = [
+            ControllerPointsModel(
                 id=0,  # Explicitly set problematic id=0
                 controller_ip_address="192.168.1.100",
                 bacnet_object_type=BacnetObjectTypeEnum.ANALOG_OUTPUT,
@@ -172,8 +197,9 @@ class TestSQLiteSessionConcurrencyFixes:
                 controller_device_id="id_zero_device",
                 present_value=f"zero_{i}",
             )
-            points.append(point)
-            print(f"🔍 Created point {i} with explicit id=0: {point.id}")
+            for i in range(3)
+        ]
+        logger.debug("Created %d points with explicit id=0", len(points))
 
         # Session concurrency fixes should handle this defensively
         await bulk_insert_controller_points(points)
@@ -183,42 +209,23 @@ class TestSQLiteSessionConcurrencyFixes:
         for i, point in enumerate(points):
             assert point.id is not None
             assert point.id > 0
-            print(f"✅ Defensive handling: point {i} now has valid id={point.id}")
-
-        print("🎉 Defensive id=0 handling successful!")
+            logger.debug(
+                "Defensive handling: point %d now has valid id=%s", i, point.id
+            )
 
-    @pytest.mark.asyncio
-    async def test_error_classification(self):
+    @pytest.mark.parametrize("error", SESSION_ERRORS, ids=str)
+    def test_session_error_nonretryable(self, error):
         """Test that InvalidRequestError is properly classified as non-retryable"""
+        assert not _is_retryable_error(
+            error
+        ), f"Session error should be non-retryable: {error}"
 
-        from src.network.sqlmodel_client import _is_retryable_error
-
-        # Test InvalidRequestError patterns
-        session_errors = [
-            Exception("InvalidRequestError: Could not refresh instance"),
-            Exception("Instance is not persistent within this Session"),
-            Exception("object is not bound to a session"),
-            Exception("object is already attached to session"),
-        ]
-
-        for error in session_errors:
-            is_retryable = _is_retryable_error(error)
-            assert not is_retryable, f"Session error should be non-retryable: {error}"
-            print(f"✅ Correctly classified as non-retryable: {error}")
-
-        # Test that database lock errors are still retryable
-        retryable_errors = [
-            Exception("database is locked"),
-            Exception("database table is locked"),
-            Exception("connection was invalidated"),
-        ]
-
-        for error in retryable_errors:
-            is_retryable = _is_retryable_error(error)
-            assert is_retryable, f"Database lock error should be retryable: {error}"
-            print(f"✅ Correctly classified as retryable: {error}")
-
-        print("🎉 Error classification working correctly!")
+    @pytest.mark.parametrize("error", RETRYABLE_ERRORS, ids=str)
+    def test_lock_error_retryable(self, error):
+        """Test that database lock errors are still retryable"""
+        assert _is_retryable_error(
+            error
+        ), f"Database lock error should be retryable: {error}"
 
 
 if __name__ == "__main__":
@@ -241,11 +248,15 @@ if __name__ == "__main__":
         await test_instance.test_id_zero_defensive_handling()
 
         print("\n4. Testing error classification...")
-        await test_instance.test_error_classification()
+        for error in SESSION_ERRORS:
+            test_instance.test_session_error_nonretryable(error)
+        for error in RETRYABLE_ERRORS:
+            test_instance.test_lock_error_retryable(error)
 
         print(
             "\n🎉 All session concurrency tests passed! Implementation ready for production."
         )
 
-    # Run if executed directly
+    # Run if executed directly, showing the per-point debug output
+    logging.basicConfig(level=logging.DEBUG)
     asyncio.run(run_session_concurrency_tests())
@@ -7,12 +7,6 @@ User Story: As a data engineer, I want upload failures to preserve data integrit
 import pytest
 import asyncio
 import time
-import sys
-
-# Add the fixtures directory to the path
-sys.path.insert(
-    0, "/Users/amol/Documents/ai-projects/bms-project/apps/bms-iot-app/tests"
-)
 
 from fixtures.actor_test_harness import ActorTestHarness
 
@@ -6,7 +6,7 @@ User Story: As a developer, I want the ActorTestHarness to work reliably for tes
 
 import pytest
 import asyncio
-from tests.fixtures.actor_test_harness import ActorTestHarness
+from tests.fixtures.actor_test_harness import ActorTestHarness, Message
 
 
 def assert_message_sent(harness, sender, receiver, message_type):
@@ -203,3 +203,113 @@ async def test_clear_message_log():
     assert len(harness.get_received_messages("BACNET")) == 0
 
     await harness.cleanup()
+
+
+def test_message_to_dict_omits_default_fields():
+    """Test: Message.to_dict only carries optional fields that were set"""
+    message = Message(type="PING", sender="mqtt", receiver="bacnet", payload={})
+    assert message.to_dict() == {
+        "type": "PING",
+        "sender": "mqtt",
+        "receiver": "bacnet",
+        "payload": {},
+    }
+
+    ordered = Message(
+        type="PING", sender="mqtt", receiver="bacnet", payload={}, id="m1", sequence=0
+    )
+    assert ordered.to_dict()["id"] == "m1"
+    assert ordered.to_dict()["sequence"] == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_every_actor_once():
+    """Test: BROADCAST reaches each actor once; only non-senders are told"""
+    harness = ActorTestHarness()
+    await harness.initialize()
+    handled = []
+
+    async def handler(message):
+        handled.append(message["type"])
+
+    harness.register_message_handler("uploader", handler)
+
+    await harness.send_message(
+        Message(type="HEARTBEAT", sender="mqtt", receiver="BROADCAST", payload={})
+    )
+
+    assert len(harness.get_actor_messages("mqtt")) == 1
+    assert harness.actors["mqtt"].received_messages == []
+    for actor_name in ["bacnet_monitoring", "uploader", "heartbeat"]:
+        assert len(harness.get_actor_messages(actor_name)) == 1
+        assert len(harness.actors[actor_name].received_messages) == 1
+    assert handled == ["HEARTBEAT"]
+    assert sorted(entry.receiver for entry in harness.get_message_log()) == [
+        "bacnet_monitoring",
+        "heartbeat",
+        "uploader",
+    ]
+
+    await harness.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_returns_delivered_message():
+    """Test: get_by_id finds a delivered message without scanning the mailbox"""
+    harness = ActorTestHarness()
+    await harness.initialize()
+
+    await harness.send_message(
+        Message(
+            type="PING", sender="mqtt", receiver="uploader", payload={}, id="ping_1"
+        )
+    )
+
+    assert harness.get_by_id("uploader", "ping_1")["type"] == "PING"
+    assert harness.get_by_id("uploader", "missing") is None
+
+    await harness.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_get_actor_messages_returns_copy():
+    """Test: get_actor_messages neither exposes nor creates harness mailboxes"""
+    harness = ActorTestHarness()
+    await harness.initialize()
+
+    await harness.send_message(
+        Message(type="PING", sender="mqtt", receiver="uploader", payload={})
+    )
+
+    messages = harness.get_actor_messages("uploader")
+    messages.clear()
+    assert len(harness.get_actor_messages("uploader")) == 1
+
+    assert harness.get_actor_messages("unknown_actor") == []
+    assert "unknown_actor" not in harness._actor_messages
+
+    await harness.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_send_message_with_ack_sends_broadcast():
+    """Test: An ack request on a BROADCAST still delivers it to every actor"""
+    harness = ActorTestHarness()
+    await harness.initialize()
+
+    ack = await harness.send_message_with_ack(
+        Message(
+            type="HEARTBEAT",
+            sender="mqtt",
+            receiver="BROADCAST",
+            payload={},
+            id="broadcast_1",
+        ),
+        timeout=0.5,
+    )
+
+    assert ack == {"message_id": "broadcast_1", "status": "timeout"}
+    for actor_name in ["bacnet_monitoring", "uploader", "heartbeat"]:
+        assert harness.get_by_id(actor_name, "broadcast_1") is not None
+
+    await harness.cleanup()
@@ -126,7 +126,7 @@ class TestMonitorAllDevicesBasicFunctionality:
             mock_manager.get_utilization_info = AsyncMock(
                 return_value={"reader_1": {"active": 0}}
             )
-            mock_health_processor.process_all_health_properties.return_value = {
+            mock_health_processor.process_all.return_value = {
                 "status_flags": "processed_flags",
                 "event_state": "normal",
                 "out_of_service": False,
@@ -216,7 +216,7 @@ class TestMonitorAllDevicesBasicFunctionality:
             mock_manager.get_utilization_info = AsyncMock(
                 return_value={"reader_1": {"active": 0}}
             )
-            mock_health_processor.process_all_health_properties.return_value = {
+            mock_health_processor.process_all.return_value = {
                 "status_flags": "processed_flags",
                 "event_state": "normal",
                 "out_of_service": False,
@@ -459,7 +459,7 @@ class TestMonitorAllDevicesErrorHandling:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute
             await self.monitor.monitor_all_devices()
@@ -524,9 +524,7 @@ class TestMonitorAllDevicesPropertyHandling:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {
-                "status_flags": "normal"
-            }
+            mock_health.process_all.return_value = {"status_flags": "normal"}
 
             # Execute
             await self.monitor.monitor_all_devices()
@@ -585,7 +583,7 @@ class TestMonitorAllDevicesPropertyHandling:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute
             await self.monitor.monitor_all_devices()
@@ -637,7 +635,7 @@ class TestMonitorAllDevicesPropertyHandling:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute
             await self.monitor.monitor_all_devices()
@@ -727,7 +725,7 @@ class TestMonitorAllDevicesMultiController:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute
             await self.monitor.monitor_all_devices()
@@ -783,7 +781,7 @@ class TestMonitorAllDevicesMultiController:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute
             await self.monitor.monitor_all_devices()
@@ -865,7 +863,7 @@ class TestMonitorAllDevicesWrapperManagement:
                 side_effect=lambda: next(wrapper_iter)
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute
             await self.monitor.monitor_all_devices()
@@ -975,7 +973,7 @@ class TestMonitorAllDevicesDataIntegrity:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {
+            mock_health.process_all.return_value = {
                 "status_flags": "processed_normal",
                 "event_state": "normal",
                 "out_of_service": False,
@@ -1048,7 +1046,7 @@ class TestMonitorAllDevicesDataIntegrity:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute
             await self.monitor.monitor_all_devices()
@@ -1108,9 +1106,7 @@ class TestMonitorAllDevicesAdvancedScenarios:
 
             # Health processor throws exception, but the actual monitoring should succeed
             # The exception happens after the read operation
-            mock_health.process_all_health_properties.side_effect = Exception(
-                "Health processing failed"
-            )
+            mock_health.process_all.side_effect = Exception("Health processing failed")
 
             # Execute monitoring - should continue despite health processor error
             await self.monitor.monitor_all_devices()
@@ -1178,7 +1174,7 @@ class TestMonitorAllDevicesAdvancedScenarios:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
             mock_insert.side_effect = mock_insert_side_effect
 
             # Execute monitoring - should not crash and continue processing
@@ -1291,7 +1287,7 @@ class TestMonitorAllDevicesAdvancedScenarios:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute monitoring - should complete without hanging
             import time
@@ -1376,7 +1372,7 @@ class TestMonitorAllDevicesAdvancedScenarios:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute monitoring
             await self.monitor.monitor_all_devices()
@@ -1431,7 +1427,7 @@ class TestMonitorAllDevicesAdvancedScenarios:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute multiple concurrent monitoring calls
             tasks = [
@@ -1508,7 +1504,7 @@ class TestMonitorAllDevicesAdvancedScenarios:
             mock_manager.get_utilization_info = AsyncMock(
                 return_value={"reader_1": {"active": 0}}
             )
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute monitoring
             await self.monitor.monitor_all_devices()
@@ -1655,7 +1651,7 @@ class TestMonitorAllDevicesEdgeCases:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute - should handle gracefully
             await self.monitor.monitor_all_devices()
@@ -1707,7 +1703,7 @@ class TestMonitorAllDevicesEdgeCases:
                 return_value=mock_wrapper
             )
             mock_manager.get_utilization_info = AsyncMock(return_value={})
-            mock_health.process_all_health_properties.return_value = {}
+            mock_health.process_all.return_value = {}
 
             # Execute
             await self.monitor.monitor_all_devices()
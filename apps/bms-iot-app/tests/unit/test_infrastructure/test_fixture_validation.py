@@ -181,10 +181,10 @@ class TestAsyncTestingInfrastructure:
     """Test async testing infrastructure"""
 
     @pytest.mark.asyncio
-    async def test_event_loop_fixture_functionality(self, event_loop):
-        """Test: Event loop fixture provides working async environment"""
-        # This test runs in the fixture-provided event loop
-        assert event_loop is not None
+    async def test_event_loop_functionality(self):
+        """Test: pytest-asyncio provides a working async environment"""
+        # This test runs in the session loop created from event_loop_policy
+        assert asyncio.get_running_loop().is_running()
 
         # Test basic async operations
         async def sample_async_operation():
@@ -97,7 +97,9 @@ class TestControllerPointsDatabaseOperations:
     @pytest.mark.asyncio
     async def test_insert_controller_point_success(self):
         """Test: Successful point insertion"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             mock_session = AsyncMock()
 
             # Create async context manager mock
@@ -105,7 +107,7 @@ class TestControllerPointsDatabaseOperations:
             mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             point = ControllerPointsModel(
                 controller_ip_address="192.168.1.100",
@@ -165,7 +167,9 @@ class TestControllerPointsDatabaseOperations:
     @pytest.mark.asyncio
     async def test_delete_uploaded_points(self):
         """Test: Delete points that have been uploaded"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             mock_session = AsyncMock()
 
             # Create async context manager mock
@@ -173,7 +177,7 @@ class TestControllerPointsDatabaseOperations:
             mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             # Create mock uploaded points
             mock_point1 = Mock(spec=ControllerPointsModel)
@@ -200,7 +204,9 @@ class TestControllerPointsDatabaseOperations:
     @pytest.mark.asyncio
     async def test_mark_points_as_uploaded(self):
         """Test: Mark points as uploaded"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             mock_session = AsyncMock()
 
             # Create async context manager mock
@@ -208,7 +214,7 @@ class TestControllerPointsDatabaseOperations:
             mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             # Create mock points with IDs
             mock_point1 = Mock(spec=ControllerPointsModel)
@@ -227,7 +233,9 @@ class TestControllerPointsDatabaseOperations:
     @pytest.mark.asyncio
     async def test_mark_points_as_uploaded_empty_list(self):
         """Test: Mark points as uploaded with empty list"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             mock_session = AsyncMock()
 
             # Create async context manager mock
@@ -235,7 +243,7 @@ class TestControllerPointsDatabaseOperations:
             mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             await mark_points_as_uploaded([])
 
@@ -280,7 +288,10 @@ class TestControllerPointsDatabaseOperations:
     @pytest.mark.asyncio
     async def test_database_operations_with_session_failure(self):
         """Test: Database operations handle session failures gracefully"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with (
+            patch("src.models.controller_points.get_session") as mock_get_session,
+            patch("src.models.controller_points.get_write_session", mock_get_session),
+        ):
             # Mock context manager that raises exception on enter
             mock_context_manager = AsyncMock()
             mock_context_manager.__aenter__ = AsyncMock(
@@ -352,7 +363,9 @@ class TestControllerPointsEdgeCases:
     @pytest.mark.asyncio
     async def test_mark_points_as_uploaded_with_none_ids(self):
         """Test: Mark points as uploaded when some points have None IDs"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             mock_session = AsyncMock()
 
             # Create async context manager mock
@@ -360,7 +373,7 @@ class TestControllerPointsEdgeCases:
             mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             # Create mock points, some with None IDs
             mock_point1 = Mock(spec=ControllerPointsModel)
@@ -392,7 +405,9 @@ class TestBulkInsertControllerPoints:
     @pytest.mark.asyncio
     async def test_bulk_insert_success(self):
         """Test: Successful bulk insertion of multiple points"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             mock_session = AsyncMock()
 
             # Create async context manager mock
@@ -400,7 +415,7 @@ class TestBulkInsertControllerPoints:
             mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             # Create test points
             points = [
@@ -441,7 +456,9 @@ class TestBulkInsertControllerPoints:
     @pytest.mark.asyncio
     async def test_bulk_insert_database_error(self):
         """Test: Bulk insert handles database errors gracefully"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             mock_session = AsyncMock()
 
             # Create async context manager mock
@@ -449,7 +466,7 @@ class TestBulkInsertControllerPoints:
             mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             # Create test points
             points = [
@@ -480,7 +497,9 @@ class TestBulkInsertControllerPoints:
     @pytest.mark.asyncio
     async def test_bulk_insert_session_failure(self):
         """Test: Bulk insert raises exception when session fails"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             # Mock context manager that raises exception on enter
             mock_context_manager = AsyncMock()
             mock_context_manager.__aenter__ = AsyncMock(
@@ -488,7 +507,7 @@ class TestBulkInsertControllerPoints:
             )
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             points = [
                 ControllerPointsModel(
@@ -507,7 +526,9 @@ class TestBulkInsertControllerPoints:
     @pytest.mark.asyncio
     async def test_bulk_insert_large_batch(self):
         """Test: Bulk insert handles large batches efficiently"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             mock_session = AsyncMock()
 
             # Create async context manager mock
@@ -515,7 +536,7 @@ class TestBulkInsertControllerPoints:
             mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             # Create 100 test points
             points = []
@@ -550,7 +571,9 @@ class TestBulkInsertControllerPoints:
     @pytest.mark.asyncio
     async def test_bulk_insert_with_health_properties(self):
         """Test: Bulk insert preserves health monitoring properties"""
-        with patch("src.models.controller_points.get_session") as mock_get_session:
+        with patch(
+            "src.models.controller_points.get_write_session"
+        ) as mock_get_write_session:
             mock_session = AsyncMock()
 
             # Create async context manager mock
@@ -558,7 +581,7 @@ class TestBulkInsertControllerPoints:
             mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
             mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-            mock_get_session.return_value = mock_context_manager
+            mock_get_write_session.return_value = mock_context_manager
 
             # Create point with health properties
             point = ControllerPointsModel(
@@ -9,6 +9,7 @@ from unittest.mock import patch
 from src.network.sqlmodel_client import (
     get_session,
     get_session_metrics,
+    get_write_session,
     log_session_metrics,
 )
 from src.models.iot_device_status import upsert_iot_device_status
@@ -224,6 +225,83 @@ class TestSessionConcurrency:
         log_session_metrics()  # Should complete without error
 
 
+class TestWriteSession:
+    """Test get_write_session serializes writers and rejects nesting"""
+
+    @pytest.mark.asyncio
+    async def test_nested_write_session_raises(self):
+        """Test opening a write session inside one fails instead of deadlocking"""
+        async with get_write_session():
+            with pytest.raises(RuntimeError, match="not re-entrant"):
+                async with get_write_session():
+                    pass
+
+        # The outer session released the lock on exit
+        async with asyncio.timeout(1):
+            async with get_write_session():
+                pass
+
+    @pytest.mark.asyncio
+    async def test_second_writer_waits_for_holder(self):
+        """Test a writer blocks until the current holder leaves its session"""
+        events = []
+        holder_entered = asyncio.Event()
+
+        async def holder():
+            async with get_write_session():
+                events.append("holder_enter")
+                holder_entered.set()
+                await asyncio.sleep(0.05)
+                events.append("holder_exit")
+
+        async def waiter():
+            await holder_entered.wait()
+            async with get_write_session():
+                events.append("waiter_enter")
+
+        await asyncio.gather(holder(), waiter())
+
+        assert events == ["holder_enter", "holder_exit", "waiter_enter"]
+
+    @pytest.mark.asyncio
+    async def test_task_spawned_inside_write_session_waits(self):
+        """Test a child task's write session is queued, not treated as nesting"""
+        async with get_write_session():
+            child = asyncio.create_task(self._open_write_session())
+            await asyncio.sleep(0.01)
+            assert not child.done()
+
+        async with asyncio.timeout(1):
+            await child
+
+    @pytest.mark.asyncio
+    async def test_writer_times_out_while_lock_held(self):
+        """Test waiting on a held write lock is bounded"""
+        holder_entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def holder():
+            async with get_write_session():
+                holder_entered.set()
+                await release.wait()
+
+        holder_task = asyncio.create_task(holder())
+        await holder_entered.wait()
+        try:
+            with patch("src.network.sqlmodel_client.WRITE_LOCK_TIMEOUT_SECONDS", 0.05):
+                with pytest.raises(TimeoutError, match="write lock"):
+                    async with get_write_session():
+                        pass
+        finally:
+            release.set()
+            await holder_task
+
+    @staticmethod
+    async def _open_write_session():
+        async with get_write_session():
+            pass
+
+
 class TestSessionConcurrencyIntegration:
     """Integration tests for session concurrency in real scenarios"""
 
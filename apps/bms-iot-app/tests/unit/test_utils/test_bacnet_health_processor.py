@@ -13,6 +13,7 @@ import json
 from unittest.mock import Mock
 from datetime import datetime, timezone
 
+from fixtures.bacnet import EventTransitionBits, LimitEnable, PriorityArray
 from src.utils.bacnet_health_processor import BACnetHealthProcessor
 
 
@@ -29,6 +30,16 @@ class TestBACnetHealthProcessorExisting:
         result = BACnetHealthProcessor.process_status_flags(None)
         assert result is None
 
+    def test_process_status_flags_all_no_flags_set(self):
+        """Test: All-zero status flags list maps to None"""
+        result = BACnetHealthProcessor.process_status_flags([0, 0, 0, 0])
+        assert result is None
+
+    def test_process_status_flags_all_flags_set(self):
+        """Test: All status flags keep BACnet bit order"""
+        result = BACnetHealthProcessor.process_status_flags([1, 1, 1, 1])
+        assert result == "in-alarm;fault;overridden;out-of-service"
+
 
 class TestBACnetOptionalPropertiesProcessor:
     """
@@ -80,20 +91,9 @@ class TestBACnetOptionalPropertiesProcessor:
     def test_process_priority_array_with_bacnet_object(self):
         """Test: PriorityArray processing with mock BACnet PriorityArray object"""
         # RED: This will FAIL - method doesn't exist yet
-        mock_priority_array = Mock()
-        mock_priority_array.__class__.__name__ = "PriorityArray"
-
-        # Mock array access - need to handle self parameter
-        def mock_getitem(self, index):
-            if index == 7:
-                return 25.0
-            elif index == 15:
-                return 18.5
-            return None
+        priority_array = PriorityArray({7: 25.0, 15: 18.5})
 
-        mock_priority_array.__getitem__ = mock_getitem
-
-        result = BACnetHealthProcessor.process_priority_array(mock_priority_array)
+        result = BACnetHealthProcessor.process_priority_array(priority_array)
 
         expected_array = [None] * 16
         expected_array[7] = 25.0
@@ -133,11 +133,9 @@ class TestBACnetOptionalPropertiesProcessor:
     def test_process_limit_enable_with_bacnet_object(self):
         """Test: LimitEnable processing with mock BACnet LimitEnable object"""
         # RED: This will FAIL - method doesn't exist yet
-        mock_limit_enable = Mock()
-        mock_limit_enable.__class__.__name__ = "LimitEnable"
-        mock_limit_enable.value = [1, 0]
+        limit_enable = LimitEnable([1, 0])
 
-        result = BACnetHealthProcessor.process_limit_enable(mock_limit_enable)
+        result = BACnetHealthProcessor.process_limit_enable(limit_enable)
         expected = json.dumps({"lowLimitEnable": True, "highLimitEnable": False})
         assert result == expected
 
@@ -172,12 +170,10 @@ class TestBACnetOptionalPropertiesProcessor:
     def test_process_event_transition_bits_with_bacnet_object(self):
         """Test: EventTransitionBits processing with mock BACnet object"""
         # RED: This will FAIL - method doesn't exist yet
-        mock_event_bits = Mock()
-        mock_event_bits.__class__.__name__ = "EventTransitionBits"
-        mock_event_bits.value = [0, 1, 1]
+        event_bits = EventTransitionBits([0, 1, 1])
 
         result = BACnetHealthProcessor.process_event_transition_bits(
-            mock_event_bits, "eventEnable"
+            event_bits, "eventEnable"
         )
         expected = json.dumps({"toFault": False, "toNormal": True, "toOffnormal": True})
         assert result == expected
@@ -422,3 +418,21 @@ class TestBACnetOptionalPropertiesProcessor:
 
         for key in expected_keys:
             assert key in result
+
+    def test_process_all_matches_merged_health_and_optional(self):
+        """Test: Single pass returns the same dict as merging both processors"""
+        raw_properties = {
+            "statusFlags": [1, 0, 0, 1],
+            "eventState": "normal",
+            "outOfService": False,
+            "highLimit": 85.0,
+            "limitEnable": [1, 0],
+            "eventDetectionEnable": True,
+        }
+
+        result = BACnetHealthProcessor.process_all(raw_properties)
+
+        assert result == {
+            **BACnetHealthProcessor.process_all_health_properties(raw_properties),
+            **BACnetHealthProcessor.process_all_optional_properties(raw_properties),
+        }